@@ -47,12 +47,11 @@
         pythonEnv = pkgs.python3.withPackages (ps: with ps; [
           mutagen
           musicbrainzngs
-          thefuzz
           requests
           unidecode
           pillow
           beautifulsoup4
-          rapidfuzz      # Required by syncedlyrics
+          rapidfuzz      # Fuzzy matching (also required by syncedlyrics)
           syncedlyrics 
           lyricsgenius
         ]);
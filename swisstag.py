@@ -3,19 +3,25 @@ import os
 import sys
 import json
 import argparse
-import subprocess
-import importlib
+import importlib.util
 import logging
+import random
 import re
 import shutil
+import stat
 import time
-import webbrowser
 import math
 import contextlib
+import errno
+import hashlib
+import sqlite3
+import threading
+import zlib
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 # --- Constants & Configuration ---
@@ -37,6 +43,8 @@ else:
     else:
         CONFIG_DIR = Path.home() / ".config" / "swisstag"
     CONFIG_FILE = CONFIG_DIR / "config.json"
+CACHE_FILE = CONFIG_DIR / "cache.sqlite"
+AUDIO_EXTS = ('.mp3', '.flac', '.m4a', '.ogg')
 
 # --- ANSI Colors ---
 class Colors:
@@ -164,6 +172,22 @@ DETAILED_HELP_TEXT = {
         config  : Log config loading.
         all     : Enable all debug modes.
     """,
+    "force-refresh": """
+    --force-refresh
+    Ignore cached Genius/MusicBrainz/syncedlyrics responses and query the APIs again.
+    Fresh responses still overwrite the cache.
+    
+    The cache lives next to the config file (cache.sqlite). Entries never expire
+    unless cache.ttl (seconds) is set. Disable it with -S cache.enabled=false.
+    """,
+    "jobs": """
+    --jobs, -j
+    Number of worker processes that load, tag and save files in Album Mode.
+    Lyrics/cover lookups are unaffected; they are network-bound and fetched up front.
+    
+    Default: defaults.workers from the config (0 = one per CPU core).
+    Example: -j 1 (tag files one at a time)
+    """,
     "install-deps": """
     --install-deps
     Automatically installs required Python dependencies via pip.
@@ -189,6 +213,8 @@ HELP_MAP = {
     "-c": "cover-art", "--cover-art": "cover-art",
     "-C": "config", "--config": "config",
     "-d": "debug", "--debug": "debug",
+    "-j": "jobs", "--jobs": "jobs",
+    "--force-refresh": "force-refresh",
     "--install-deps": "install-deps",
     "--setup-token": "setup-token"
 }
@@ -198,7 +224,7 @@ REQUIRED_PACKAGES = {
     "mutagen": "mutagen",
     "lyricsgenius": "lyricsgenius",
     "musicbrainzngs": "musicbrainzngs",
-    "thefuzz": "thefuzz",
+    "rapidfuzz": "rapidfuzz",
     "requests": "requests",
     "unidecode": "unidecode",
     "PIL": "Pillow",
@@ -206,14 +232,11 @@ REQUIRED_PACKAGES = {
 }
 
 def check_dependencies() -> List[str]:
-    missing = []
-    for import_name, install_name in REQUIRED_PACKAGES.items():
-        try:
-            importlib.import_module(import_name)
-        except ImportError:
-            missing.append(install_name)
+    # find_spec only locates the package; nothing is executed or added to sys.modules
+    missing = [install_name for import_name, install_name in REQUIRED_PACKAGES.items()
+               if importlib.util.find_spec(import_name) is None]
     # Check for fpcalc binary for fingerprinting
-    if "--chromaprint" in sys.argv or "-p" in sys.argv:
+    if not {"--chromaprint", "-p"}.isdisjoint(sys.argv):
         if not shutil.which("fpcalc"):
              print(f"{Colors.YELLOW}[WARN] 'fpcalc' (chromaprint) not found. Fingerprinting will fail.{Colors.RESET}")
     return missing
@@ -224,33 +247,28 @@ def install_dependencies_interactive(missing: List[str]):
     in_venv = hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
     if not in_venv:
         cmd.extend(["--user", "--break-system-packages"])
+    import subprocess
     try:
         subprocess.check_call(cmd)
         os.execv(sys.executable, [sys.executable] + sys.argv)
     except subprocess.CalledProcessError:
         sys.exit(1)
 
-_missing_deps = check_dependencies()
-if "--install-deps" in sys.argv:
-    if _missing_deps: install_dependencies_interactive(_missing_deps)
-    else: sys.exit(0)
-if _missing_deps:
-    print(f"[{APP_NAME}] Critical dependencies missing: {', '.join(_missing_deps)}")
-    sys.exit(1)
-
-import requests
-import mutagen
-from mutagen.id3 import ID3, APIC, TIT2, TPE1, TALB, TDRC, USLT, COMM, TCON, TPE2, TRCK
-from mutagen.mp3 import MP3
-from mutagen.flac import FLAC, Picture
-from mutagen.mp4 import MP4, MP4Cover
-from mutagen.oggvorbis import OggVorbis
-import musicbrainzngs
-import lyricsgenius
-import syncedlyrics
-from unidecode import unidecode
-from thefuzz import fuzz
-from PIL import Image
+def ensure_dependencies():
+    """Exits if a required package is missing, or installs them with --install-deps."""
+    missing = check_dependencies()
+    if "--install-deps" in sys.argv:
+        if missing: install_dependencies_interactive(missing)
+        else: sys.exit(0)
+    if missing:
+        print(f"[{APP_NAME}] Critical dependencies missing: {', '.join(missing)}")
+        sys.exit(1)
+
+# Help, version/about and config get/set only need the standard library, so they skip the dependency check
+NO_DEPS_FLAGS = frozenset({"-h", "--help", "-v", "--version", "--about", "-C", "--config"})
+
+# Third-party modules (requests, mutagen, PIL, lyricsgenius, ...) are imported inside the functions
+# that use them, so --help, --version and -C don't pay their import cost.
 
 # --- Config & Defaults ---
 DEFAULT_CONFIG = {
@@ -258,13 +276,15 @@ DEFAULT_CONFIG = {
         "rename": False,
         "match_filename": True,
         "feat_handling": "keep-title",
+        "workers": 0,
         "lyrics": {"fetch": True, "mode": "embed", "source": "interactive"},
         "cover": {"size": "1920x1920", "keep_resized": True, "extract": {"crop": False, "scale": True}}
     },
     "separators": {"artist": "; ", "genre": "; "},
-    "regex": {"featured_artist": r"(?i)[(\[](?:feat|ft|featuring|with)\.?\s+(.*?)[)\]]"},
+    "regex": {"featured_artist": r"(?i)[(\[](?:feat(?:uring)?|ft|with)\.?\s+([^)\]]*)[)\]]"},
     "artist_groups": {},
     "aliases": {},
+    "cache": {"enabled": True, "ttl": 0},
     "api_keys": {
         "genius": "",
         "acoustid": "cSpUJKpD" # Default generic key
@@ -273,6 +293,26 @@ DEFAULT_CONFIG = {
 
 # --- Helpers ---
 
+# Default featured-artist pattern; Tagger only compiles the configured one if it was changed
+_DEFAULT_FEAT_RE = re.compile(DEFAULT_CONFIG["regex"]["featured_artist"])
+# Earlier default, still present in saved configs; it matches exactly the same strings
+_LEGACY_FEAT_PATTERN = r"(?i)[(\[](?:feat|ft|featuring|with)\.?\s+(.*?)[)\]]"
+# Separators between artists in "feat." lists and plain artist strings
+_FEAT_SPLIT_RE = re.compile(r"\s*(?:,|&)\s*")
+# Characters that are not allowed in file/directory names
+_SANITIZE_TABLE = str.maketrans('', '', '<>:"/\\|?*')
+# Filename noise stripped before searching/matching: release tags, any other bracketed text, leading track numbers
+_NOISE_TAG_RE = re.compile(r'\s*[\(\[].*?(Official Music Video|Lyrics|Audio|Explicit|Remix|Live|\d+kbps).*?[\)\]]', re.IGNORECASE)
+_BRACKETED_RE = re.compile(r'\s*[\(\[].*?[\)\]]')
+_TRACKNUM_RE = re.compile(r'^\s*\d+\s*[-.]?\s*')
+# Reissue tags that don't change a song's lyrics: "(Remastered 2011)", "[Deluxe Edition]", " - 2009 Remaster"
+_EDITION_RE = re.compile(r'\s*[\(\[][^\)\]]*\b(?:remaster(?:ed)?|deluxe|edition|mono|stereo)\b[^\)\]]*[\)\]]'
+                         r'|\s+-\s+(?:\d{4}\s+)?remaster(?:ed)?\b.*$', re.IGNORECASE)
+# One "file:track" (or "file:s") pair in a batch answer to the manual matching prompt
+# syncedlyrics reports provider errors (e.g. Musixmatch 401s) through these loggers, one per provider class
+_SYNCEDLYRICS_LOGGERS = ("syncedlyrics", "Musixmatch", "Lrclib", "Deezer", "NetEase", "Megalobiz", "Genius")
+_MATCH_PAIR_RE = re.compile(r'(\d+)\s*:\s*(\d+|s)')
+
 class Logger:
     def __init__(self, debug_str: Optional[str]):
         self.modes = set(debug_str.split(',')) if debug_str else set()
@@ -289,32 +329,45 @@ class Logger:
     def error(self, message: str): print(f"{Colors.RED}[ERROR] {message}{Colors.RESET}", file=sys.stderr)
 
 class TreeUI:
-    def __init__(self, total, album_name=None):
+    # finish() status -> (icon, label); built once rather than per track
+    _STATUS = {
+        'success': (f"{Colors.GREEN}[✓]{Colors.RESET}", "Done"),
+        'warning': (f"{Colors.YELLOW}[!]{Colors.RESET}", "Attention Required"),
+        'error': (f"{Colors.RED}[✗]{Colors.RESET}", "Failed"),
+    }
+
+    def __init__(self, total, album_name=None, heading="Retagging album"):
         self.total = total
         self.idx = 0
         self.prefix = "├──"
         self.root_indent = "    "
+        # Children of a "├──" item continue the trunk; the last item's children don't
+        self._branch_indent = self.root_indent + "│   "
+        self._last_indent = self.root_indent + "    "
+        self.sub_indent = self._branch_indent
+        # Step lines are transient progress; only worth a flush per call when someone is watching a terminal
+        self._live = sys.stdout.isatty()
         self.current_title = ""
         if album_name:
-            print(f"{self.root_indent}Retagging album: {Colors.BOLD}{album_name}{Colors.RESET}")
+            print(f"{self.root_indent}{heading}: {Colors.BOLD}{album_name}{Colors.RESET}")
 
     def next(self, title):
         self.idx += 1
-        self.prefix = "└──" if self.idx == self.total else "├──"
+        is_last = self.idx == self.total
+        self.prefix = "└──" if is_last else "├──"
+        self.sub_indent = self._last_indent if is_last else self._branch_indent
         self.current_title = title
         # Print basic title first
         print(f"{self.root_indent}{self.prefix} {title} ({self.idx}/{self.total})")
 
     def _get_sub_indent(self):
-        # Calculate indentation for children messages based on current prefix
-        if "├" in self.prefix:
-            return self.root_indent + "│   "
-        return self.root_indent + "    "
+        # Indentation for children messages, set by next() from the current prefix
+        return self.sub_indent
 
     def step(self, msg):
         indent = self._get_sub_indent()
         sys.stdout.write(f"{Colors.CLR}{indent}└── {msg}")
-        sys.stdout.flush()
+        if self._live: sys.stdout.flush()
 
     def message(self, text, color=None):
         # Permanent message that respects tree structure
@@ -332,16 +385,7 @@ class TreeUI:
 
     def finish(self, status: str = 'success', warnings: List[str] = None):
         indent = self._get_sub_indent()
-        
-        icon = f"{Colors.GREEN}[✓]{Colors.RESET}"
-        
-        extra_msg = "Done"
-        if status == 'warning': 
-            icon = f"{Colors.YELLOW}[!]{Colors.RESET}"
-            extra_msg = "Attention Required"
-        elif status == 'error': 
-            icon = f"{Colors.RED}[✗]{Colors.RESET}"
-            extra_msg = "Failed"
+        icon, extra_msg = TreeUI._STATUS.get(status, TreeUI._STATUS['success'])
 
         sys.stdout.write(f"{Colors.CLR}") # Clear any pending step
         print(f"{indent}└── {icon} {extra_msg}")
@@ -351,31 +395,61 @@ class TreeUI:
                 print(f"{indent}    {Colors.YELLOW}↳ {w}{Colors.RESET}")
 
 class ConfigManager:
+    _MISSING = object()  # Cached marker for dotted paths that don't exist, so get() falls back to its default
+
     def __init__(self, cli_overrides: List[str] = None):
+        self._saved_bytes: Optional[bytes] = None  # What's currently on disk, to skip no-op saves
+        self._get_cache: Dict[str, Any] = {}  # Resolved dotted paths; cleared by set()
         self.data = self._load()
         if cli_overrides: self._apply_overrides(cli_overrides)
 
+    def __getstate__(self):
+        # Cached misses hold the _MISSING sentinel, which doesn't survive pickling; workers rebuild the cache
+        state = self.__dict__.copy()
+        state['_get_cache'] = {}
+        return state
+
     def _load(self) -> Dict:
-        if not CONFIG_FILE.exists():
+        # Read straight away rather than checking exists() first; a missing file is the rare case
+        try: raw = CONFIG_FILE.read_bytes()
+        except FileNotFoundError:
             CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-            with open(CONFIG_FILE, 'w') as f: json.dump(DEFAULT_CONFIG, f, indent=4)
+            self._write(DEFAULT_CONFIG)
             return DEFAULT_CONFIG
-        with open(CONFIG_FILE, 'r') as f:
-            try: return json.load(f)
-            except json.JSONDecodeError: return DEFAULT_CONFIG
+        self._saved_bytes = raw
+        try: return json.loads(raw)
+        except ValueError: return DEFAULT_CONFIG
+
+    def _write(self, data: Dict):
+        payload = json.dumps(data, indent=4).encode('utf-8')
+        if payload == self._saved_bytes: return
+        # Write to a sibling temp file and swap it in, so an interrupted save can't truncate the config.
+        # Swap the symlink's target (stow/home-manager setups) and keep its mode; it may hold API tokens.
+        target = CONFIG_FILE.resolve()
+        try: mode = stat.S_IMODE(target.stat().st_mode)
+        except FileNotFoundError: mode = 0o600
+        tmp = target.with_name(target.name + ".tmp")
+        with os.fdopen(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode), 'wb') as f:
+            os.fchmod(f.fileno(), mode)  # os.open's mode is masked by the umask
+            f.write(payload)
+        os.replace(tmp, target)
+        self._saved_bytes = payload
 
     def save(self):
-        with open(CONFIG_FILE, 'w') as f: json.dump(self.data, f, indent=4)
+        self._write(self.data)
 
     def get(self, path: str, default=None):
-        keys = path.split('.')
-        val = self.data
-        for key in keys:
-            if isinstance(val, dict) and key in val: val = val[key]
-            else: return default
-        return val
+        if path in self._get_cache: val = self._get_cache[path]
+        else:
+            val = self.data
+            for key in path.split('.'):
+                if isinstance(val, dict) and key in val: val = val[key]
+                else: val = ConfigManager._MISSING; break
+            self._get_cache[path] = val
+        return default if val is ConfigManager._MISSING else val
 
     def set(self, path: str, value: Any):
+        self._get_cache.clear()
         keys = path.split('.')
         target = self.data
         for key in keys[:-1]: target = target.setdefault(key, {})
@@ -390,37 +464,230 @@ class ConfigManager:
                 elif v.isdigit(): v = int(v)
                 self.set(k, v)
 
-def api_retry(max_retries=3, delay=2):
+def http_status(e: BaseException) -> Optional[int]:
+    """Status code of a failed request. lyricsgenius raises HTTPError(status, msg) without a response attached."""
+    status = getattr(getattr(e, 'response', None), 'status_code', None)
+    if status is None and e.args and isinstance(e.args[0], int): status = e.args[0]
+    return status
+
+def api_retry(max_retries=3, delay=2, cap=30):
+    """
+    Retries transient request failures with decorrelated-jitter backoff (or the server's Retry-After).
+    Client errors other than 429 won't succeed on retry, so they're raised straight away.
+    """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            retries = 0
-            while retries < max_retries:
+            import requests
+            sleep = delay
+            for attempt in range(1, max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except (requests.exceptions.RequestException, TimeoutError) as e:
-                    retries += 1
-                    if retries == max_retries: raise e
-                    time.sleep(delay * retries)
+                    status = http_status(e)
+                    if attempt == max_retries or (status and 400 <= status < 500 and status != 429): raise
+                    retry_after = getattr(getattr(e, 'response', None), 'headers', {}).get('Retry-After', '')
+                    if retry_after.isdigit(): sleep = min(cap, int(retry_after))
+                    else: sleep = min(cap, random.uniform(delay, sleep * 3))
+                    time.sleep(sleep)
             return None
         return wrapper
     return decorator
 
+class ResponseCache:
+    """On-disk cache of API responses (zlib-compressed JSON in SQLite). ttl=0 means entries never expire."""
+    def __init__(self, path: Path, ttl: int = 0):
+        self.ttl = ttl
+        self.refresh = False
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        # WAL: readers don't block on the writer, and each put() is an append instead of a journal rewrite
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, ts INTEGER, body BLOB)")
+        self._db.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        if self.refresh: return None
+        with self._lock:
+            row = self._db.execute("SELECT ts, body FROM responses WHERE url=?", (key,)).fetchone()
+        if not row: return None
+        ts, body = row
+        if self.ttl and time.time() - ts > self.ttl: return None
+        try: return json.loads(zlib.decompress(body))
+        except (zlib.error, ValueError): return None
+
+    def put(self, key: str, value: Any):
+        try: body = zlib.compress(json.dumps(value).encode('utf-8'))
+        except (TypeError, ValueError): return  # Not JSON-serializable, don't cache
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO responses (url, ts, body) VALUES (?, ?, ?)",
+                             (key, int(time.time()), body))
+            self._db.commit()
+
+def cache_key(endpoint: str, args: tuple) -> str:
+    return f"{endpoint}:{json.dumps(args, default=str)}"
+
+def cached(endpoint: str, key_args: Optional[Callable[..., tuple]] = None):
+    """
+    Caches a MetadataProvider method's result in self.cache, keyed by (endpoint, args). Empty results aren't stored.
+    key_args, if given, maps the call's args to the ones used in the key, so equivalent calls share an entry.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args):
+            cache = getattr(self, 'cache', None)
+            if cache is None: return func(self, *args)
+            key = cache_key(endpoint, key_args(*args) if key_args else args)
+            hit = cache.get(key)
+            if hit is not None:
+                self.logger.log("network", f"Cache hit: {key}")
+                return hit
+            res = func(self, *args)
+            if res: cache.put(key, res)
+            return res
+        return wrapper
+    return decorator
+
 def get_attr(obj, key, default=None):
     if isinstance(obj, dict): return obj.get(key, default)
     return getattr(obj, key, default)
 
+def normalize_for_match(s: Optional[str]) -> str:
+    """Accent-stripped, case-folded, punctuation-free form of s used for fuzzy comparisons."""
+    from rapidfuzz import utils
+    from unidecode import unidecode
+    return utils.default_process(unidecode(s or '').casefold())
+
+def lyrics_key(title: Optional[str], artist: Optional[str]) -> tuple:
+    """Cache key for lyrics lookups: case/accent-insensitive, and reissue tags like "(Remastered)" are ignored."""
+    return (normalize_for_match(_EDITION_RE.sub('', title or '')), normalize_for_match(artist))
+
+FICLONE = 0x40049409  # Linux ioctl: share extents with another file (btrfs, XFS, bcachefs)
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Copy-on-write clones src to dst. Returns False where reflinks aren't supported."""
+    try: import fcntl
+    except ImportError: return False
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    except OSError:
+        with contextlib.suppress(OSError): os.unlink(dst)
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+def fast_move(src: Path, dst: Path):
+    """
+    Moves src to dst. Tries a plain rename first, then (across subvolumes/mounts) a reflink,
+    which is O(1) on CoW filesystems, and only then falls back to shutil.move's full copy.
+    """
+    try:
+        os.rename(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV: raise
+    if _reflink(src, dst):
+        os.unlink(src)
+        return
+    shutil.move(src, dst)
+
+def write_bytes(path: Path, data: bytes):
+    """Writes data in one unbuffered write() (looping only on short writes)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view: view = view[os.write(fd, view):]
+    finally: os.close(fd)
+
+def jpeg_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """(width, height) read from a JPEG's SOF header without decoding; None if data isn't a parseable JPEG."""
+    if data[:2] != b'\xff\xd8': return None
+    i, n = 2, len(data)
+    while i + 9 < n:
+        if data[i] != 0xFF: return None
+        marker = data[i + 1]
+        if marker == 0xFF: i += 1; continue  # Fill byte
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9: i += 2; continue  # Standalone markers carry no length
+        # SOF0-SOF15, except DHT (C4), JPG (C8) and DAC (CC) which share the range
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            h, w = int.from_bytes(data[i + 5:i + 7], 'big'), int.from_bytes(data[i + 7:i + 9], 'big')
+            return (w, h) if w and h else None
+        i += 2 + int.from_bytes(data[i + 2:i + 4], 'big')
+    return None
+
+def fuzzy_score_matrix(queries: List[str], choices: List[str], score_cutoff: float = 0) -> List[List[float]]:
+    """
+    Scores every query against every choice. Pairs below score_cutoff are left at 0.
+    Both lists must already be normalized with normalize_for_match.
+    """
+    from rapidfuzz import fuzz, process
+    if importlib.util.find_spec("numpy") is not None:
+        # cdist needs numpy (optional for us); it scores the whole matrix in one call across all cores
+        return process.cdist(queries, choices, scorer=fuzz.token_sort_ratio,
+                             score_cutoff=score_cutoff, dtype="float64", workers=-1).tolist()
+    matrix = []
+    for q in queries:
+        row = [0.0] * len(choices)
+        # extract() scores the whole choice list in C and bails out early on pairs below the cutoff
+        for _, score, j in process.extract(q, choices, scorer=fuzz.token_sort_ratio,
+                                           limit=None, score_cutoff=score_cutoff):
+            row[j] = score
+        matrix.append(row)
+    return matrix
+
+def assign_best_pairs(scores: List[List[float]]) -> List[Tuple[int, int]]:
+    """
+    One-to-one assignment (Hungarian algorithm) maximizing the total score.
+    Returns (row, col) pairs sorted by row. Works for rectangular matrices.
+    """
+    if not scores or not scores[0]: return []
+    transposed = len(scores) > len(scores[0])
+    if transposed: scores = [list(col) for col in zip(*scores)]
+    n, m = len(scores), len(scores[0])
+    inf = float('inf')
+    u = [0.0] * (n + 1); v = [0.0] * (m + 1)
+    p = [0] * (m + 1); way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        p[0] = i; j0 = 0
+        minv = [inf] * (m + 1); used = [False] * (m + 1)
+        while True:
+            used[j0] = True; i0 = p[j0]; delta = inf; j1 = 0
+            for j in range(1, m + 1):
+                if used[j]: continue
+                cur = -scores[i0 - 1][j - 1] - u[i0] - v[j]
+                if cur < minv[j]: minv[j] = cur; way[j] = j0
+                if minv[j] < delta: delta = minv[j]; j1 = j
+            for j in range(m + 1):
+                if used[j]: u[p[j]] += delta; v[j] -= delta
+                else: minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0: break
+        while j0:
+            j1 = way[j0]; p[j0] = p[j1]; j0 = j1
+    pairs = [(p[j] - 1, j - 1) for j in range(1, m + 1) if p[j]]
+    if transposed: pairs = [(c, r) for r, c in pairs]
+    return sorted(pairs)
+
 class TokenWizard:
     @staticmethod
     def run(config_mgr: ConfigManager):
         print("\n=== Genius API Token Setup ===")
+        import webbrowser  # Only the token wizard opens a browser, so other runs skip the import
         webbrowser.open("https://genius.com/api-clients")
         token = input("\nPaste your 'Client Access Token' here: ").strip()
         if not token: return
+        import lyricsgenius
         try:
             genius = lyricsgenius.Genius(token, verbose=False)
             res = genius.search_songs("Test", per_page=1)
             if res:
+                # Still validated above; only the save is skipped when nothing changed
+                if token == config_mgr.get("api_keys.genius"):
+                    print("Token valid (unchanged).")
+                    return
                 config_mgr.set("api_keys.genius", token)
                 config_mgr.save()
                 print(f"Token saved.")
@@ -428,51 +695,80 @@ class TokenWizard:
 
 class MetadataProvider:
     def __init__(self, config: ConfigManager, logger: Logger):
+        import requests
+        import lyricsgenius
+        import musicbrainzngs
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
         self.config = config
         self.logger = logger
         self.genius = None
         self.mb_active = True
+        # Shared keep-alive pool for our own requests (AcoustID, cover downloads). musicbrainzngs keeps its own
+        # urllib transport, which also enforces MusicBrainz's 1 request/second limit, so it isn't routed through here.
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = f"{APP_NAME}/{VERSION}"
+        self.session.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=50,
+                           max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])))
         token = config.get("api_keys.genius") or os.environ.get("GENIUS_ACCESS_TOKEN")
         if token:
             self.genius = lyricsgenius.Genius(token, verbose=False)
+            # lyricsgenius keeps its own session (with its auth headers); widen its pool instead of replacing it.
+            # Retries stay with api_retry so failures aren't retried twice.
+            genius_session = getattr(self.genius, '_session', None)
+            if genius_session is not None:
+                genius_session.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=50))
         else:
             self.logger.warn("No Genius Token found.")
         musicbrainzngs.set_useragent(APP_NAME, VERSION, "user@localhost")
+        # Hide syncedlyrics' 401 spam by muting its loggers; redirecting stdout/stderr instead isn't
+        # thread-safe and would swallow our own output from the other prefetch threads too
+        for name in _SYNCEDLYRICS_LOGGERS: logging.getLogger(name).setLevel(logging.CRITICAL + 1)
+        self._song_cache: Dict[Any, Any] = {}
+        self._hits_cache: Dict[Tuple[str, str], Any] = {}
+        self._fp_cache: Dict[Tuple[str, int, int], Dict] = {}
+        self._acoustid_cache: Dict[Tuple[int, str], Optional[Dict]] = {}  # (duration, fingerprint) -> best match
+        self._acoustid_lock = threading.Lock()
+        self._acoustid_next = 0.0  # Earliest time the next AcoustID request may start
+        self._last_cover: Optional[Tuple[str, bytes]] = None  # (url, bytes) of the last downloaded cover
+        self.cache = None
+        if config.get("cache.enabled", True):
+            try: self.cache = ResponseCache(CACHE_FILE, ttl=int(config.get("cache.ttl", 0) or 0))
+            except (sqlite3.Error, OSError) as e: self.logger.warn(f"Response cache disabled: {e}")
         self.acoustid_key = config.get("api_keys.acoustid", "cSpUJKpD")
 
+    def _genius_forbidden(self, e: BaseException, context: str = "") -> bool:
+        """On 403 Forbidden, disables the Genius provider and warns the user. Returns whether it did."""
+        if http_status(e) != 403: return False
+        self.logger.warn(f"Genius API returned 403 Forbidden{context}. Disabling Genius provider.\n"
+                         "Set a valid token in config or via GENIUS_ACCESS_TOKEN to re-enable.")
+        self.genius = None
+        return True
+
+    @cached("search_songs")
     @api_retry()
     def _genius_search_hits(self, title, artist):
+        if (title, artist) in self._hits_cache: return self._hits_cache[(title, artist)]
         if not self.genius: return {}
+        import requests
         try:
-            return self.genius.search_songs(f"{artist} {title}", per_page=5)
+            hits = self.genius.search_songs(f"{artist} {title}", per_page=5)
+            if hits: self._hits_cache[(title, artist)] = hits
+            return hits
         except requests.exceptions.HTTPError as e:
-            # If Genius is returning 403 Forbidden, disable the provider and warn the user
-            status = getattr(getattr(e, 'response', None), 'status_code', None)
-            if status == 403:
-                try:
-                    self.logger.warn("Genius API returned 403 Forbidde n. Disabling Genius provider.\n" \
-                                     "Set a valid token in config or via GENIUS_ACCESS_TOKEN to re-enable.")
-                except Exception:
-                    pass
-                self.genius = None
-                return {}
+            if self._genius_forbidden(e): return {}
             raise
 
+    @cached("search_albums")
     @api_retry()
     def search_album_candidates(self, query: str) -> List[Dict]:
         if not self.genius: return []
+        import requests
         self.logger.log("network", f"Searching Genius for albums: {query}")
         try:
             res = self.genius.search_albums(query, per_page=5)
         except requests.exceptions.HTTPError as e:
-            status = getattr(getattr(e, 'response', None), 'status_code', None)
-            if status == 403:
-                try:
-                    self.logger.warn("Genius API returned 403 Forbidden while searching albums. Disabling Genius provider.")
-                except Exception:
-                    pass
-                self.genius = None
-                return []
+            if self._genius_forbidden(e, " while searching albums"): return []
             raise
         candidates = []
         if res and 'sections' in res:
@@ -490,21 +786,24 @@ class MetadataProvider:
                         })
         return candidates
 
-    @api_retry()
     def fetch_album_by_id(self, album_id: int) -> Dict:
+        data = self._genius_album(album_id)
+        # The year is looked up outside the "album" cache entry, so a failed MusicBrainz request is retried next run
+        if data and self.mb_active and data['album'] and data['artist']:
+            release = self._mb_release(data['artist'], data['album'])
+            if release: data['year'] = release['year']
+        return data
+
+    @cached("album")
+    @api_retry()
+    def _genius_album(self, album_id: int) -> Dict:
         if not self.genius: return {}
+        import requests
         self.logger.log("network", f"Fetching Album Details ID: {album_id}")
         try:
             album_raw = self.genius.album(album_id)
         except requests.exceptions.HTTPError as e:
-            status = getattr(getattr(e, 'response', None), 'status_code', None)
-            if status == 403:
-                try:
-                    self.logger.warn("Genius API returned 403 Forbidden while fetching album. Disabling Genius provider.")
-                except Exception:
-                    pass
-                self.genius = None
-                return {}
+            if self._genius_forbidden(e, " while fetching album"): return {}
             raise
         album_info = album_raw['album'] if (isinstance(album_raw, dict) and 'album' in album_raw) else album_raw
         
@@ -523,34 +822,85 @@ class MetadataProvider:
                     "title": t_song.get('title'),
                     "number": t.get('number'),
                     "id": t_song.get('id'),
-                    "artist": t_song.get('artist_names')
+                    "artist": t_song.get('artist_names'),
+                    "_norm_title": normalize_for_match(t_song.get('title'))
                 })
-        
-        if self.mb_active and data['album'] and data['artist']:
-            try:
-                mb_res = musicbrainzngs.search_releases(artist=data['artist'], release=data['album'], limit=1)
-                if mb_res['release-list']:
-                    rel = mb_res['release-list'][0]
-                    if 'date' in rel: data['year'] = rel['date'][:4]
-            except Exception: pass
         return data
 
+    @cached("mb_release")
+    def _mb_release(self, artist: str, album: str) -> Optional[Dict]:
+        """
+        MusicBrainz release year for (artist, album). Misses come back as {"year": None} so they
+        are cached too; network errors return None and are retried next time.
+        """
+        import musicbrainzngs
+        try: mb_res = musicbrainzngs.search_releases(artist=artist, release=album, limit=1)
+        except Exception: return None
+        rel = mb_res['release-list'][0] if mb_res.get('release-list') else {}
+        return {"year": rel['date'][:4] if rel.get('date') else None}
+
+    @cached("song")
     @api_retry()
     def _genius_get_song(self, song_id):
+        if song_id in self._song_cache: return self._song_cache[song_id]
         if not self.genius: return None
+        import requests
         try:
-            return self.genius.song(song_id)
+            song = self.genius.song(song_id)
+            if song: self._song_cache[song_id] = song
+            return song
         except requests.exceptions.HTTPError as e:
-            status = getattr(getattr(e, 'response', None), 'status_code', None)
-            if status == 403:
-                try:
-                    self.logger.warn("Genius API returned 403 Forbidden while fetching song. Disabling Genius provider.")
-                except Exception:
-                    pass
-                self.genius = None
-                return None
+            if self._genius_forbidden(e, " while fetching song"): return None
             raise
 
+    def prefetch_songs(self, song_ids: List[Any], max_workers: int = 8):
+        """Fetches song details for many tracks concurrently so later per-track lookups hit the cache."""
+        pending = [sid for sid in dict.fromkeys(song_ids) if sid and sid not in self._song_cache]
+        if not self.genius or not pending: return
+        self.logger.log("network", f"Prefetching {len(pending)} songs ({max_workers} workers)")
+
+        def _fetch(sid):
+            # Failures are retried serially later by the normal per-track path
+            try: self._genius_get_song(sid)
+            except Exception: pass
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            list(pool.map(_fetch, pending))
+
+    def prefetch_search_hits(self, queries: List[Tuple[str, str]], max_workers: int = 4):
+        """Runs the Genius searches for many (title, artist) pairs concurrently so later lookups hit the cache."""
+        pending = [q for q in dict.fromkeys(queries) if all(q) and q not in self._hits_cache]
+        if not self.genius or not pending: return
+        self.logger.log("network", f"Prefetching {len(pending)} searches ({max_workers} workers)")
+
+        def _fetch(q):
+            # Failures are retried serially later by the normal per-file path
+            try: self._genius_search_hits(*q)
+            except Exception: pass
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            list(pool.map(_fetch, pending))
+
+    def prefetch_lyrics(self, tracks: List[Tuple[Any, str, str]], source_mode: str, max_workers: int = 8) -> Dict[Any, Optional[str]]:
+        """
+        Fetches lyrics for many (track_id, title, artist) tuples concurrently ({track_id: lyrics}).
+        Only lookups that never prompt run here; for auto, a miss still needs rescue_lyrics() afterwards.
+        """
+        if source_mode not in ('genius', 'synced', 'auto') or not tracks: return {}
+        self.logger.log("network", f"Prefetching lyrics for {len(tracks)} tracks ({max_workers} workers)")
+
+        failed = object()
+        def _fetch(t):
+            try:
+                if source_mode == 'auto': return self._auto_lyrics(t[0], t[1], t[2])
+                return self.fetch_lyrics_for_track(t[0], title=t[1], artist=t[2], source_mode=source_mode)
+            except Exception: return failed
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tracks))) as pool:
+            results = zip((t[0] for t in tracks), pool.map(_fetch, tracks))
+            # Failed tracks are left out so the normal per-track path tries them again
+            return {track_id: lyrics for track_id, lyrics in results if lyrics is not failed}
+
     def interactive_lyrics_picker(self, title, artist, ui: Optional['TreeUI'] = None) -> Optional[str]:
         """
         Interactive Wizard to choose lyrics source with Retry Loop.
@@ -635,12 +985,18 @@ class MetadataProvider:
                 return None
             # Loop continues otherwise
 
+    @cached("search_lyrics", key_args=lyrics_key)
+    def _genius_search_lyrics(self, title, artist) -> Optional[str]:
+        if not self.genius: return None
+        song = self.genius.search_song(title, artist, get_full_info=False)
+        return song.lyrics if song else None
+
+    @cached("synced_lyrics", key_args=lyrics_key)
     def get_synced_lyrics(self, title, artist):
         self.logger.log("network", f"Searching syncedlyrics for: {title} - {artist}")
         try:
-            # Suppress stdout/stderr from syncedlyrics to hide 401 spam
-            with open(os.devnull, 'w') as f, contextlib.redirect_stdout(f), contextlib.redirect_stderr(f):
-                lyrics = syncedlyrics.search(f"{artist} {title}")
+            import syncedlyrics
+            lyrics = syncedlyrics.search(f"{artist} {title}")
             
             if lyrics:
                 self.logger.log("vars", f"Found synced lyrics (len {len(lyrics)})")
@@ -668,9 +1024,18 @@ class MetadataProvider:
 
         # 4. AUTO MODE (Default)
         # Priority: Genius ID -> Genius Search Fallback -> SyncedLyrics -> Interactive Rescue
-        
+        lyrics = self._auto_lyrics(track_id, title, artist) or self.rescue_lyrics(title, artist, ui=ui)
+
+        if lyrics:
+            self.logger.log("vars", f"Lyrics len: {len(lyrics)}")
+        else:
+            self.logger.log("vars", "No lyrics found.")
+        return lyrics
+
+    def _auto_lyrics(self, track_id, title, artist) -> Optional[str]:
+        """Auto mode's lookups that never prompt: Genius ID, then Genius search, then syncedlyrics."""
         lyrics = None
-        
+
         # A. Try Genius ID
         self.logger.log("network", f"Fetching Lyrics ID: {track_id}")
         try:
@@ -685,18 +1050,19 @@ class MetadataProvider:
         # B. Try Genius Search Fallback
         if not lyrics and title and artist:
             self.logger.log("network", f"ID failed. Fallback Genius search: {title}")
-            try:
-                fallback = self.genius.search_song(title, artist, get_full_info=False)
-                if fallback: lyrics = fallback.lyrics
+            try: lyrics = self._genius_search_lyrics(title, artist)
             except Exception: pass
         
         # C. Try SyncedLyrics
         if not lyrics and title and artist:
              self.logger.log("network", "Genius empty. Trying syncedlyrics...")
              lyrics = self.get_synced_lyrics(title, artist)
-             
-        # D. Interactive Rescue (If Auto failed and we are in a terminal)
-        if not lyrics and sys.stdin.isatty():
+        return lyrics
+
+    def rescue_lyrics(self, title, artist, ui: Optional['TreeUI'] = None) -> Optional[str]:
+        """D. Interactive Rescue: offers the lyrics picker when auto mode found nothing and we are in a terminal."""
+        lyrics = None
+        if sys.stdin.isatty():
              # Use UI if available, else standard print
              msg = f"Auto-fetch failed for: {title}"
              # We pass UI object to be used if available
@@ -709,11 +1075,6 @@ class MetadataProvider:
              
              if choice == 'y':
                  lyrics = self.interactive_lyrics_picker(title, artist, ui=ui)
-
-        if lyrics:
-            self.logger.log("vars", f"Lyrics len: {len(lyrics)}")
-        else:
-            self.logger.log("vars", "No lyrics found.")
         return lyrics
 
     def fetch_song_data(self, query: Dict, source_mode="auto") -> Dict:
@@ -725,16 +1086,17 @@ class MetadataProvider:
         if self.genius and data['title'] and data['artist']:
             hits = self._genius_search_hits(data["title"], data["artist"])
             best_hit = None
-            best_score = 0
             if hits and isinstance(hits, dict) and 'hits' in hits:
-                for hit in hits['hits']:
-                    res = hit['result']
-                    # Calculate score based on fuzzy title match
-                    score = fuzz.token_sort_ratio(res['title'], data['title'])
-                    if score > best_score:
-                        best_score = score; best_hit = res
+                from rapidfuzz import fuzz, process, utils
+                # Score all hits on fuzzy title match in a single call (argmax + cutoff fused)
+                results = {h['result']['id']: h['result'] for h in hits['hits']}
+                best = process.extractOne(
+                    data['title'], {k: r['title'] for k, r in results.items()},
+                    scorer=fuzz.token_sort_ratio, processor=utils.default_process, score_cutoff=70
+                )
+                if best: best_hit = results[best[2]]
             
-            if best_hit and best_score >= 70:
+            if best_hit:
                 song = self._genius_get_song(best_hit['id'])
                 if isinstance(song, dict) and 'song' in song: song = song['song']
                 
@@ -769,116 +1131,290 @@ class MetadataProvider:
 
         return data
 
+    def download_file(self, url: str, dest: Optional[Path] = None) -> bytes:
+        """Streams url in chunks and returns the downloaded bytes; also writes them to dest if given."""
+        self.logger.log("network", f"Downloading: {url}")
+        buf = BytesIO()
+        with self.session.get(url, stream=True, timeout=(3.05, 15)) as r:
+            r.raise_for_status()
+            for chunk in r.iter_content(64 * 1024): buf.write(chunk)
+        data = buf.getvalue()
+        if dest is not None: write_bytes(dest, data)
+        return data
+
+    def fetch_cover(self, url: str) -> bytes:
+        """Downloads cover art and returns its bytes; repeat downloads of the same URL are skipped."""
+        if self._last_cover is None or self._last_cover[0] != url:
+            self._last_cover = (url, self.download_file(url))
+        return self._last_cover[1]
+
+    @cached("fpcalc")
+    def _fpcalc(self, path: str, mtime_ns: int, size: int) -> Dict:
+        """fpcalc's JSON output for a file. mtime/size are only part of the cache key, so edited files are re-read."""
+        self.logger.log("cmd", f"fpcalc -json '{path}'")
+        import subprocess
+        res = subprocess.run(["fpcalc", "-json", path], capture_output=True, check=True)
+        return json.loads(res.stdout)
+
+    def fingerprint(self, filepath: Path) -> Dict:
+        st = filepath.stat()
+        key = (str(filepath), st.st_mtime_ns, st.st_size)
+        if key not in self._fp_cache: self._fp_cache[key] = self._fpcalc(*key)
+        return self._fp_cache[key]
+
+    def prefetch_fingerprints(self, paths: List[Path], max_workers: Optional[int] = None):
+        """
+        Fingerprints many files up front. The files are split into one batch per CPU and each batch
+        is a single fpcalc run, so process startup is paid per batch instead of per file.
+        Files that fail are simply left for the normal per-file path, which reports the error.
+        """
+        if not paths or not shutil.which("fpcalc"): return
+        pending: Dict[str, Tuple[str, int, int]] = {}
+        for p in paths:
+            try: st = p.stat()
+            except OSError: continue
+            key = (str(p), st.st_mtime_ns, st.st_size)
+            if key in self._fp_cache: continue
+            hit = self.cache.get(cache_key("fpcalc", key)) if self.cache else None
+            if hit is not None: self._fp_cache[key] = hit
+            else: pending[key[0]] = key
+        if not pending: return
+        workers = min(max_workers or os.cpu_count() or 1, len(pending))
+        names = list(pending)
+
+        import subprocess
+        def _run(batch):
+            # -json output doesn't name the file, so parse the FILE=/DURATION=/FINGERPRINT= records instead.
+            # fpcalc only prints FILE= when given several files; a lone record belongs to the batch's only file.
+            self.logger.log("cmd", f"fpcalc <{len(batch)} files>")
+            try: out = subprocess.run(["fpcalc", *batch], capture_output=True, text=True).stdout
+            except OSError: return
+            records: List[Dict[str, str]] = []
+            for line in out.splitlines():
+                k, sep, v = line.partition("=")
+                if not sep: continue
+                if k == "FILE" or not records: records.append({})
+                records[-1][k] = v
+            for fields in records:
+                key = pending.get(fields.get("FILE") or (batch[0] if len(batch) == 1 else None))
+                if key is None or not fields.get("FINGERPRINT"): continue
+                data = {"duration": float(fields.get("DURATION") or 0), "fingerprint": fields["FINGERPRINT"]}
+                self._fp_cache[key] = data
+                if self.cache: self.cache.put(cache_key("fpcalc", key), data)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_run, [names[i::workers] for i in range(workers)]))
+
     def get_acoustic_fingerprint(self, filepath: Path) -> Optional[Dict]:
         """Runs fpcalc and queries AcoustID."""
         if not shutil.which("fpcalc"): return None
         try:
-            self.logger.log("cmd", f"fpcalc -json '{filepath}'")
-            res = subprocess.check_output(["fpcalc", "-json", str(filepath)], stderr=subprocess.DEVNULL)
-            fp_data = json.loads(res)
+            fp_data = self.fingerprint(filepath)
             
             duration = fp_data.get("duration")
             fingerprint = fp_data.get("fingerprint")
             
             if duration and fingerprint:
-                self.logger.log("network", "Querying AcoustID API...")
-                url = "https://api.acoustid.org/v2/lookup"
-                params = {
-                    "client": self.acoustid_key,
-                    "meta": "recordings+releasegroups",
-                    "duration": int(duration),
-                    "fingerprint": fingerprint
-                }
-                r = requests.get(url, params=params)
-                if r.status_code == 200:
-                    resp = r.json()
-                    if resp.get("results"):
-                        # Get best result
-                        result = resp["results"][0]
-                        if result.get("recordings"):
-                            rec = result["recordings"][0]
-                            title = rec.get("title")
-                            artists = [a["name"] for a in rec.get("artists", [])]
-                            album = None
-                            if rec.get("releasegroups"):
-                                album = rec["releasegroups"][0].get("title")
-                            
-                            return {
-                                "title": title,
-                                "artist": artists[0] if artists else "Unknown",
-                                "album": album,
-                                "duration": duration
-                            }
+                match = self._acoustid_match(int(duration), fingerprint)
+                if match: return {**match, "duration": duration}
         except Exception as e:
             self.logger.error(f"Fingerprinting failed: {e}")
         return None
 
+    def _acoustid_match(self, duration: int, fingerprint: str) -> Optional[Dict]:
+        """
+        Best AcoustID recording ({"title", "artist", "album"}) for a fingerprint, or None.
+        Answers are kept for the run so prefetch_acoustid and the per-file path share them; failed requests aren't.
+        """
+        key = (duration, fingerprint)
+        if key in self._acoustid_cache: return self._acoustid_cache[key]
+        # AcoustID allows 3 requests per second; space out request starts across threads
+        with self._acoustid_lock:
+            wait = self._acoustid_next - time.monotonic()
+            if wait > 0: time.sleep(wait)
+            self._acoustid_next = time.monotonic() + 1 / 3
+        self.logger.log("network", "Querying AcoustID API...")
+        url = "https://api.acoustid.org/v2/lookup"
+        params = {
+            "client": self.acoustid_key,
+            "meta": "recordings+releasegroups",
+            "duration": duration,
+            "fingerprint": fingerprint
+        }
+        r = self.session.get(url, params=params, timeout=(3.05, 10))
+        if r.status_code != 200: return None
+        match = None
+        resp = r.json()
+        if resp.get("results"):
+            # Get best result
+            result = resp["results"][0]
+            if result.get("recordings"):
+                rec = result["recordings"][0]
+                artists = [a["name"] for a in rec.get("artists", [])]
+                album = None
+                if rec.get("releasegroups"):
+                    album = rec["releasegroups"][0].get("title")
+                match = {"title": rec.get("title"), "artist": artists[0] if artists else "Unknown", "album": album}
+        self._acoustid_cache[key] = match
+        return match
+
+    def prefetch_acoustid(self, paths: List[Path], max_workers: int = 3):
+        """Queries AcoustID for many already-fingerprinted files concurrently so later lookups reuse the answers."""
+        keys = []
+        for p in paths:
+            try: st = p.stat()
+            except OSError: continue
+            fp = self._fp_cache.get((str(p), st.st_mtime_ns, st.st_size))
+            if fp and fp.get("duration") and fp.get("fingerprint"): keys.append((int(fp["duration"]), fp["fingerprint"]))
+        pending = [k for k in dict.fromkeys(keys) if k not in self._acoustid_cache]
+        if not pending: return
+        self.logger.log("network", f"Prefetching {len(pending)} AcoustID lookups ({max_workers} workers)")
+
+        def _fetch(key):
+            # Failures are retried serially later by the normal per-file path, which reports them
+            try: self._acoustid_match(*key)
+            except Exception: pass
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            list(pool.map(_fetch, pending))
+
 class FileHandler:
     def __init__(self, config: ConfigManager, logger: Logger):
         self.config = config
         self.logger = logger
+        self._dir_cache: Dict[str, Dict[str, str]] = {}
+        self._made_dirs: set = set()  # Autosort targets already created this run
 
-    def infer_dirs(self, path: Path) -> Dict[str, str]:
-        p = path.resolve()
-        if p.is_file(): p = p.parent
-        parts = p.parts
-        if len(parts) >= 2: return {"artist": parts[-2], "album": parts[-1]}
-        return {}
+    def list_audio_files(self, directory: Path) -> List[Path]:
+        """Audio files directly inside directory, sorted by name. One scandir pass, no per-file stat."""
+        with os.scandir(directory) as it:
+            files = [Path(e.path) for e in it if e.name.lower().endswith(AUDIO_EXTS) and e.is_file()]
+        return sorted(files)
 
-    def rename_file(self, filepath: Path, metadata: Dict):
+    def infer_dirs(self, path: Path) -> Dict[str, str]:
+        p = path if path.is_dir() else path.parent
+        # Every track in a directory gives the same answer, so resolve each directory only once
+        key = str(p)
+        if key not in self._dir_cache:
+            parts = p.resolve().parts
+            self._dir_cache[key] = {"artist": parts[-2], "album": parts[-1]} if len(parts) >= 2 else {}
+        return dict(self._dir_cache[key])
+
+    def plan_path(self, filepath: Path, metadata: Dict, rename: bool, sort: bool) -> Path:
+        """Where rename and/or autosort would put filepath. Doesn't touch the disk."""
+        name = filepath.name
         title = metadata.get("title")
-        if not title: return filepath
-        ext = filepath.suffix
-        clean_title = re.sub(r'[<>:"/\\|?*]', '', title)
-        new_path = filepath.parent / f"{clean_title}{ext}"
-        self.logger.log("cmd", f"mv '{filepath}' '{new_path}'")
-        if not self.logger.is_dry:
-            try:
-                filepath.rename(new_path)
-                return new_path
-            except OSError as e:
-                self.logger.error(f"Rename failed: {e}")
-                return filepath
+        if rename and title: name = f"{title.translate(_SANITIZE_TABLE)}{filepath.suffix}"
+        dest_dir = filepath.parent
+        if sort:
+            art_tag = metadata.get("album_artist", metadata.get("artist", "Unknown"))
+            if isinstance(art_tag, list): art_tag = art_tag[0]
+            artist = art_tag.translate(_SANITIZE_TABLE)
+            album = metadata.get("album", "Unknown Album").translate(_SANITIZE_TABLE)
+            dest_dir = filepath.parent.parent / artist / album
+        return dest_dir / name
+
+    def relocate(self, filepath: Path, metadata: Dict, rename: bool = False, sort: bool = False) -> Path:
+        """Applies rename and autosort together, so the file is moved at most once."""
+        new_path = self.plan_path(filepath, metadata, rename, sort)
+        if new_path == filepath: return filepath
+        if sort: self.logger.log("cmd", f"mkdir -p '{new_path.parent}' && mv '{filepath}' '{new_path}'")
+        else: self.logger.log("cmd", f"mv '{filepath}' '{new_path}'")
+        if self.logger.is_dry: return new_path
+        try:
+            if sort and new_path.parent not in self._made_dirs:
+                # Every track of an album lands in the same directory; only create/check it once
+                new_path.parent.mkdir(parents=True, exist_ok=True)
+                self._made_dirs.add(new_path.parent)
+            fast_move(filepath, new_path)
+        except shutil.Error: pass
+        except OSError as e:
+            self.logger.error(f"{'Move' if sort else 'Rename'} failed: {e}")
+            return filepath
         return new_path
 
+    def rename_file(self, filepath: Path, metadata: Dict) -> Path:
+        return self.relocate(filepath, metadata, rename=True)
+
     def autosort(self, filepath: Path, metadata: Dict) -> Path:
-        art_tag = metadata.get("album_artist", metadata.get("artist", "Unknown"))
-        if isinstance(art_tag, list): art_tag = art_tag[0]
-        artist = re.sub(r'[<>:"/\\|?*]', '', art_tag)
-        album = re.sub(r'[<>:"/\\|?*]', '', metadata.get("album", "Unknown Album"))
-        dest_dir = filepath.parent.parent / artist / album 
-        new_path = dest_dir / filepath.name
-        self.logger.log("cmd", f"mkdir -p '{dest_dir}' && mv '{filepath}' '{new_path}'")
-        if not self.logger.is_dry:
-            dest_dir.mkdir(parents=True, exist_ok=True)
-            try:
-                shutil.move(filepath, new_path)
-                return new_path
-            except shutil.Error: return new_path
-        return new_path
+        return self.relocate(filepath, metadata, sort=True)
 
     def save_lrc(self, filepath: Path, lyrics: str):
         lrc_path = filepath.with_suffix('.lrc')
         self.logger.log("cmd", f"Write lyrics to: {lrc_path}")
         if not self.logger.is_dry and lyrics:
-            try:
-                lrc_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(lrc_path, 'w', encoding='utf-8') as f: f.write(lyrics)
+            # The .lrc sits next to the audio file, so its directory already exists
+            try: write_bytes(lrc_path, lyrics.encode('utf-8'))
             except Exception as e: self.logger.error(f"Failed to save .lrc: {e}")
 
 class Tagger:
+    # Compiled feat patterns, shared by all instances
+    _feat_regex_cache: Dict[str, 're.Pattern'] = {_DEFAULT_FEAT_RE.pattern: _DEFAULT_FEAT_RE, _LEGACY_FEAT_PATTERN: _DEFAULT_FEAT_RE}
+
     def __init__(self, config: ConfigManager, logger: Logger):
         self.config = config
         self.logger = logger
-        self.feat_regex = re.compile(self.config.get("regex.featured_artist"))
+        feat_pattern = self.config.get("regex.featured_artist")
+        self.feat_regex = Tagger._feat_regex_cache.get(feat_pattern)
+        if self.feat_regex is None:
+            self.feat_regex = Tagger._feat_regex_cache[feat_pattern] = re.compile(feat_pattern)
+        # The default pattern only matches bracketed tokens, so bracket-less strings can skip it.
+        # A user-supplied pattern might not need brackets, so always run it.
+        self._feat_needs_brackets = self.feat_regex is _DEFAULT_FEAT_RE
+        self._feat_cache: Dict[str, Tuple[List[str], str, List[str]]] = {}
+        self._saved_covers = set()  # (cover_dir, name, digest) already written this run
+        # Alias keys lower-cased once, for case-insensitive matching
+        self._alias_map = {k.lower(): v for k, v in self.config.get("aliases", {}).items()}
+        self._group_map = {k.lower(): v for k, v in self.config.get("artist_groups", {}).items()}
+        # Accent/case-folded group names for tolerant lookups (e.g. "Alltta" vs "AllttA", "Beyonce" vs "Beyoncé")
+        self._group_keys = list(self._group_map)
+        self._group_keys_norm = [normalize_for_match(k) for k in self._group_keys]
+        self._meta_cache: Dict[Path, Dict[str, str]] = {}  # read_existing_metadata results, until the file is loaded for tagging
+        self._last_parsed = None  # (path, audio) parsed by a read-only caller, handed over to the next load_file
+
+    def __getstate__(self):
+        # Parsed files stay in this process; worker processes open their own
+        state = self.__dict__.copy()
+        state['_last_parsed'] = None
+        return state
 
     def load_file(self, path: Path):
+        self._meta_cache.pop(path, None)
+        # Reuse the object a read-only caller just parsed; from here on the caller may modify and save it
+        if self._last_parsed is not None and self._last_parsed[0] == path:
+            audio = self._last_parsed[1]
+            self._last_parsed = None
+            return audio
+        import mutagen
         try: return mutagen.File(path, easy=False)
         except Exception: return None
-    
-    def read_existing_metadata(self, path: Path) -> Dict[str, str]:
+
+    def _peek_file(self, path: Path):
+        """load_file for read-only use; the parsed object is kept so a following load_file doesn't parse it again."""
         audio = self.load_file(path)
-        if not audio: return {}
+        self._last_parsed = (path, audio) if audio is not None else None
+        return audio
+
+    def read_existing_metadata(self, path: Path) -> Dict[str, str]:
+        meta = self._meta_cache.get(path)
+        if meta is None: meta = self._meta_cache[path] = self._read_existing_metadata(path)
+        return meta
+
+    def _read_existing_metadata(self, path: Path) -> Dict[str, str]:
+        if path.suffix.lower() == '.mp3':
+            # ID3 sits at the head of the file; reading it alone skips mutagen's MPEG frame scan
+            from mutagen.id3 import ID3, ID3NoHeaderError
+            try: tags = ID3(path)
+            except ID3NoHeaderError: return {}
+            except Exception: tags = None
+            if tags is not None:
+                return {k: str(tags[f]) for k, f in (('artist', 'TPE1'), ('title', 'TIT2'), ('album', 'TALB')) if f in tags}
+        audio = self._peek_file(path)
+        if audio is None: return {}
+        from mutagen.mp3 import MP3
+        from mutagen.flac import FLAC
+        from mutagen.mp4 import MP4
+        from mutagen.oggvorbis import OggVorbis
         meta = {}
         
         # Attempt to read common tags based on type
@@ -907,17 +1443,36 @@ class Tagger:
             
         return meta
 
+    def tag_digest(self, audio) -> Optional[bytes]:
+        """Digest of the tags currently held in memory (incl. FLAC pictures); used to skip no-op writes."""
+        if audio is None or audio.tags is None: return None
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr(sorted(repr(item) for item in audio.tags.items())).encode('utf-8', 'surrogatepass'))
+        for pic in getattr(audio, 'pictures', None) or []: h.update(pic.write())
+        return h.digest()
+
+    @staticmethod
+    def _padding(info) -> int:
+        # Keep whatever padding is left while the new tags fit, so mutagen rewrites the tag block in place.
+        # When the tags outgrow it (full-file rewrite anyway), reserve room so the next re-tag fits again.
+        if info.padding >= 0: return info.padding
+        return max(info.get_default_padding(), 16 * 1024)
+
+    def save(self, audio, original_digest: Optional[bytes]) -> bool:
+        """Writes tags to disk unless they match what was loaded. Returns True if the file was written."""
+        if original_digest is not None and self.tag_digest(audio) == original_digest: return False
+        audio.save(padding=Tagger._padding)
+        return True
+
     def get_duration(self, path: Path) -> float:
         try:
-            f = mutagen.File(path)
-            return f.info.length if f and f.info else 0.0
+            f = self._peek_file(path)
+            return f.info.length if f is not None and f.info else 0.0
         except: return 0.0
 
     def apply_aliases(self, meta: Dict):
-        aliases = self.config.get("aliases", {})
-        if not aliases: return
-        # Normalize keys to lower case for matching
-        alias_map = {k.lower(): v for k, v in aliases.items()}
+        alias_map = self._alias_map
+        if not alias_map: return
         
         target_keys = ["artist", "album_artist"]
         for key in target_keys:
@@ -942,37 +1497,49 @@ class Tagger:
             
             if has_changes:
                 # Dedup preserving order
-                seen = set()
-                final = []
-                for x in new_list:
-                    if x not in seen:
-                        final.append(x)
-                        seen.add(x)
-                meta[key] = final
+                meta[key] = list(dict.fromkeys(new_list))
+
+    def _is_plain(self, s: str) -> bool:
+        """True if s can't contain a feat token or an artist list, so there's nothing to extract."""
+        # No brackets means no "(feat. X)" token, and no separators means nothing to split
+        return self._feat_needs_brackets and not ('(' in s or '[' in s or ',' in s or '&' in s)
+
+    def _extract_features(self, s: str) -> Tuple[List[str], str, List[str]]:
+        """Returns (features, cleaned string, artist names in the cleaned string), all from one regex pass."""
+        cached = self._feat_cache.get(s)
+        if cached is not None: return cached
+        found = []
+        clean_s = s
+        names = [s]
+        if self._is_plain(s):
+            self._feat_cache[s] = (found, clean_s, names)
+            return found, clean_s, names
+        try_regex = not self._feat_needs_brackets or '(' in s or '[' in s
+        match = self.feat_regex.search(s) if try_regex else None
+        if match:
+            feat_str = match.group(1)
+            # Split on commas and ampersands, allowing optional surrounding whitespace
+            found = [f.strip() for f in _FEAT_SPLIT_RE.split(feat_str) if f.strip()]
+            clean_s = self.feat_regex.sub("", s).strip()
+            # "A & B (feat. C)": the residual is itself an artist list
+            names = [f.strip() for f in _FEAT_SPLIT_RE.split(clean_s) if f.strip()] if (',' in clean_s or '&' in clean_s) else []
+            if not names: names = [clean_s]
+        else:
+            # If there's no explicit feat/with token, also handle plain artist lists
+            # like: "Artist A, Artist B & Artist C" by splitting on commas and ampersands.
+            # This allows international characters (e.g., "Łona, Andrzej & Kacper").
+            if ',' in s or '&' in s:
+                parts = [f.strip() for f in _FEAT_SPLIT_RE.split(s) if f.strip()]
+                if len(parts) > 1:
+                    found = parts
+                    # Keep the first part as the "clean" primary value
+                    clean_s = parts[0]
+                    names = [clean_s]
+        self._feat_cache[s] = (found, clean_s, names)
+        return found, clean_s, names
 
     def handle_features(self, meta: Dict, ui: Optional['TreeUI'] = None):
         mode = self.config.get("defaults.feat_handling")
-        
-        def extract_from_string(s):
-            found = []
-            clean_s = s
-            match = self.feat_regex.search(s)
-            if match:
-                feat_str = match.group(1)
-                # Split on commas and ampersands, allowing optional surrounding whitespace
-                found = [f.strip() for f in re.split(r"\s*(?:,|&)\s*", feat_str) if f.strip()]
-                clean_s = self.feat_regex.sub("", s).strip()
-            else:
-                # If there's no explicit feat/with token, also handle plain artist lists
-                # like: "Artist A, Artist B & Artist C" by splitting on commas and ampersands.
-                # This allows international characters (e.g., "Łona, Andrzej & Kacper").
-                if re.search(r'[,&]', s):
-                    parts = [f.strip() for f in re.split(r"\s*(?:,|&)\s*", s) if f.strip()]
-                    if len(parts) > 1:
-                        found = parts
-                        # Keep the first part as the "clean" primary value
-                        clean_s = parts[0]
-            return found, clean_s
 
         # FIX: Guard against NoneType error if artist is missing
         if "artist" in meta and meta["artist"] is None:
@@ -985,9 +1552,14 @@ class Tagger:
         elif not isinstance(meta["artist"], list):
             meta["artist"] = [str(meta["artist"])]
 
+        # Common case: at most one plain artist and a plain title, so nothing to move, split or warn about
+        artists = meta["artist"]
+        if len(artists) <= 1 and all(self._is_plain(a) for a in artists) and self._is_plain(meta.get("title") or ""):
+            return
+
         # Check Title for Features
         if meta.get("title"):
-            feats, clean_title = extract_from_string(meta["title"])
+            feats, clean_title, _ = self._extract_features(meta["title"])
             if feats:
                 if mode == "keep-both":
                     # Notify
@@ -997,8 +1569,7 @@ class Tagger:
                 else:
                     # Update Artist List?
                     if mode in ["split", "split-clean", "keep-title"]:
-                        for f in feats:
-                            if f not in meta["artist"]: meta["artist"].append(f)
+                        meta["artist"] = list(dict.fromkeys(meta["artist"] + feats))
                     
                     # Update Title?
                     if mode == "split":
@@ -1010,18 +1581,25 @@ class Tagger:
         if mode == "keep-both": return
 
         current_artists = list(meta["artist"])
-        new_artist_list = []
+        new_artist_list = []; seen_artists = set()
         for art in current_artists:
-            feats, clean_art = extract_from_string(art)
-            if clean_art not in new_artist_list: new_artist_list.append(clean_art)
-            for f in feats:
-                if f not in new_artist_list: new_artist_list.append(f)
+            feats, _, names = self._extract_features(art)
+            for part in (*names, *feats):
+                if part not in seen_artists: new_artist_list.append(part); seen_artists.add(part)
         meta["artist"] = new_artist_list
 
+    def _find_group_members(self, artist: str):
+        members = self._group_map.get(artist.lower())
+        if members is not None: return members
+        # No exact hit: fuzzy-match against all known groups in one call
+        from rapidfuzz import fuzz, process
+        best = process.extractOne(normalize_for_match(artist), self._group_keys_norm, scorer=fuzz.ratio, score_cutoff=92)
+        if best: return self._group_map[self._group_keys[best[2]]]
+        return None
+
     def expand_artist_groups(self, meta: Dict):
-        groups = self.config.get("artist_groups", {})
-        if not groups: return
-        group_map = {k.lower(): v for k, v in groups.items()}
+        group_map = self._group_map
+        if not group_map: return
         target_keys = ["artist", "album_artist"]
         for key in target_keys:
             if key not in meta or not meta[key]: continue
@@ -1030,14 +1608,11 @@ class Tagger:
             expanded_list = []
             for artist in current:
                 expanded_list.append(artist)
-                members = group_map.get(artist.lower())
+                members = self._find_group_members(artist)
                 if members:
                     if isinstance(members, str): members = [members]
                     expanded_list.extend(members)
-            seen = set(); final_list = []
-            for x in expanded_list:
-                if x not in seen: final_list.append(x); seen.add(x)
-            meta[key] = final_list
+            meta[key] = list(dict.fromkeys(expanded_list))
 
     def _join_artists(self, artists: Any) -> str:
         sep = self.config.get("separators.artist", "; ")
@@ -1058,23 +1633,29 @@ class Tagger:
         artist_str = self._join_artists(meta.get("artist")) if meta.get("artist") else None
         album_artist_str = self._join_artists(meta.get("album_artist")) if meta.get("album_artist") else None
 
-        if isinstance(audio, MP3): self._tag_id3(audio, meta, artist_str, album_artist_str)
-        elif isinstance(audio, FLAC): self._tag_vorbis(audio, meta, artist_str, album_artist_str)
-        elif isinstance(audio, MP4): self._tag_mp4(audio, meta, artist_str, album_artist_str)
+        from mutagen.mp3 import MP3
+        from mutagen.flac import FLAC
+        from mutagen.mp4 import MP4
+        # Looked up once per file rather than inside each format's writer
+        embed_lyrics = bool(meta.get('lyrics')) and self._should_embed()
+        if isinstance(audio, MP3): self._tag_id3(audio, meta, artist_str, album_artist_str, embed_lyrics)
+        elif isinstance(audio, FLAC): self._tag_vorbis(audio, meta, artist_str, album_artist_str, embed_lyrics)
+        elif isinstance(audio, MP4): self._tag_mp4(audio, meta, artist_str, album_artist_str, embed_lyrics)
 
         # Do NOT call audio.save() here. It's handled in the main processing loop.
 
 
     def _should_embed(self): return self.config.get("defaults.lyrics.mode") in ['embed', 'both']
 
-    def _tag_id3(self, audio, meta, artist_str, album_artist_str):
+    def _tag_id3(self, audio, meta, artist_str, album_artist_str, embed_lyrics=False):
+        from mutagen.id3 import TIT2, TPE1, TALB, TDRC, USLT, TCON, TPE2, TRCK
         if audio.tags is None: audio.add_tags()
         if meta.get('title'): audio.tags.add(TIT2(encoding=3, text=meta['title']))
         if meta.get('album'): audio.tags.add(TALB(encoding=3, text=meta['album']))
         if meta.get('year'): audio.tags.add(TDRC(encoding=3, text=str(meta['year'])))
         if meta.get('genre'): audio.tags.add(TCON(encoding=3, text=meta['genre']))
         if meta.get('track_number'): audio.tags.add(TRCK(encoding=3, text=str(meta['track_number'])))
-        if meta.get('lyrics') and self._should_embed():
+        if embed_lyrics:
             # Remove any existing USLT tags before adding a new one
             audio.tags.delall('USLT')
             audio.tags.add(USLT(encoding=3, lang='eng', desc='desc', text=meta['lyrics']))
@@ -1082,29 +1663,36 @@ class Tagger:
         if artist_str: audio.tags.add(TPE1(encoding=3, text=artist_str))
         if album_artist_str: audio.tags.add(TPE2(encoding=3, text=album_artist_str))
 
-    def _tag_vorbis(self, audio, meta, artist_str, album_artist_str):
+    def _tag_vorbis(self, audio, meta, artist_str, album_artist_str, embed_lyrics=False):
         if meta.get('title'): audio['title'] = meta['title']
         if meta.get('album'): audio['album'] = meta['album']
         if meta.get('year'): audio['date'] = str(meta['year'])
         if meta.get('genre'): audio['genre'] = meta['genre']
         if meta.get('track_number'): audio['tracknumber'] = str(meta['track_number'])
-        if meta.get('lyrics') and self._should_embed(): audio['lyrics'] = meta['lyrics']
+        if embed_lyrics: audio['lyrics'] = meta['lyrics']
         if artist_str: audio['artist'] = artist_str
         if album_artist_str: audio['albumartist'] = album_artist_str
 
-    def _tag_mp4(self, audio, meta, artist_str, album_artist_str):
+    def _tag_mp4(self, audio, meta, artist_str, album_artist_str, embed_lyrics=False):
         if meta.get('title'): audio['\xa9nam'] = meta['title']
         if meta.get('album'): audio['\xa9alb'] = meta['album']
         if meta.get('year'): audio['\xa9day'] = str(meta['year'])
         if meta.get('genre'): audio['\xa9gen'] = meta['genre']
-        if meta.get('lyrics') and self._should_embed(): audio['\xa9lyr'] = meta['lyrics']
+        if embed_lyrics: audio['\xa9lyr'] = meta['lyrics']
         if artist_str: audio['\xa9ART'] = artist_str
         if album_artist_str: audio['aART'] = album_artist_str
 
-    def apply_cover(self, audio, image_path: str):
-        if self.logger.is_dry or not image_path: return
+    def apply_cover(self, audio, image):
+        """Embeds image (JPEG bytes, or a path to read them from) as the front cover."""
+        if self.logger.is_dry or not image: return
+        from mutagen.id3 import APIC
+        from mutagen.mp3 import MP3
+        from mutagen.flac import FLAC, Picture
+        from mutagen.mp4 import MP4, MP4Cover
         try:
-            with open(image_path, 'rb') as f: img_data = f.read()
+            if isinstance(image, (bytes, bytearray)): img_data = image
+            else:
+                with open(image, 'rb') as f: img_data = f.read()
             
             # Clear existing cover art tags before adding a new one
             if isinstance(audio, MP3): 
@@ -1112,7 +1700,7 @@ class Tagger:
                  audio.tags.add(APIC(encoding=3, mime='image/jpeg', type=3, desc='Cover', data=img_data))
             elif isinstance(audio, FLAC):
                 # FLAC/Vorbis handles pictures differently (clearing is manual)
-                audio.pictures = []
+                audio.clear_pictures()
                 p = Picture(); p.type = 3; p.mime = "image/jpeg"; p.desc = "Cover"; p.data = img_data
                 audio.add_picture(p)
             elif isinstance(audio, MP4): 
@@ -1123,6 +1711,7 @@ class Tagger:
 
     def save_cover(self, audio_file_path: Path, image_data: bytes, album_name: str):
         if self.logger.is_dry or not image_data: return
+        from PIL import Image
         try:
             album_dir = audio_file_path.parent
             cover_dir = album_dir / "Cover Art"
@@ -1131,33 +1720,91 @@ class Tagger:
             keep_resized = self.config.get("defaults.cover.keep_resized", True)
             try: max_w, max_h = map(int, cfg_size_str.lower().split('x'))
             except: max_w, max_h = 1000, 1000
-            img = Image.open(BytesIO(image_data))
-            w, h = img.size
-            safe_name = re.sub(r'[<>:"/\\|?*]', '', album_name)
-            if w <= max_w and h <= max_h:
-                with open(cover_dir / f"{safe_name}.jpg", 'wb') as f: f.write(image_data)
+            safe_name = album_name.translate(_SANITIZE_TABLE)
+            # Album mode calls this once per track with the same image; only decode/encode it once
+            key = (cover_dir.resolve(), safe_name, hashlib.blake2b(image_data, digest_size=16).digest())
+            if key in self._saved_covers: return
+            # JPEG dimensions come straight from the SOF header; anything else goes through PIL.
+            # Image.open only parses the header; pixels aren't decoded unless we resize
+            dims = jpeg_size(image_data)
+            img = None if dims else Image.open(BytesIO(image_data))
+            w, h = dims or img.size
+            if w <= max_w and h <= max_h and (dims or img.format == 'JPEG'):
+                # Already fits: keep the original bytes, no decode/re-encode
+                write_bytes(cover_dir / f"{safe_name}.jpg", image_data)
+            elif w <= max_w and h <= max_h:
+                # Fits, but isn't a JPEG (e.g. PNG); convert so the .jpg file is what it says it is
+                if img.mode not in ('RGB', 'L'): img = img.convert('RGB')
+                img.save(cover_dir / f"{safe_name}.jpg", "JPEG", quality=85, optimize=True, progressive=True)
             else:
                 if keep_resized:
                     wk, hk = math.floor(w / 1000), math.floor(h / 1000)
-                    with open(cover_dir / f"{safe_name} {wk}kx{hk}k.jpg", 'wb') as f: f.write(image_data)
-                img.thumbnail((max_w, max_h))
-                img.save(cover_dir / f"{safe_name}.jpg", "JPEG")
+                    # The full-size original is only written when asked for; otherwise just the resized copy
+                    write_bytes(cover_dir / f"{safe_name} {wk}kx{hk}k.jpg", image_data)
+                if img is None: img = Image.open(BytesIO(image_data))
+                # Let libjpeg downscale during decode (1/2, 1/4, 1/8) before the final resample.
+                # Must come after reading img.size, since draft() changes it.
+                img.draft('RGB', (max_w, max_h))
+                if img.mode not in ('RGB', 'L'): img = img.convert('RGB')
+                # After draft() the image is at most ~2x the target, where bicubic matches Lanczos and is cheaper
+                img.thumbnail((max_w, max_h), Image.Resampling.BICUBIC, reducing_gap=2.0)
+                img.save(cover_dir / f"{safe_name}.jpg", "JPEG", quality=85, optimize=True, progressive=True)
+            self._saved_covers.add(key)
         except Exception as e: self.logger.error(f"Failed to save cover art to file: {e}")
 
+class MessageLog:
+    """Stand-in for TreeUI inside worker processes: records messages so the parent can replay them in order."""
+    def __init__(self):
+        self.messages: List[Tuple[str, Optional[str]]] = []
+
+    def message(self, text, color=None):
+        self.messages.append((text, color))
+
+_job_context: Optional[Tuple[Tagger, Dict, Optional[bytes]]] = None  # (tagger, manual tags, cover bytes) shared by every tag_file_job
+
+def init_tag_worker(tagger: Tagger, manual: Dict, cover_data: Optional[bytes]):
+    """Pool initializer: receives the album-wide state once per worker instead of once per track."""
+    global _job_context
+    _job_context = (tagger, manual, cover_data)
+
+def tag_file_job(filepath: Path, meta: Dict) -> Dict:
+    """
+    Loads, tags and saves a single file. Runs in a worker process, so nothing is printed here;
+    UI messages and the final (alias/feature-processed) metadata are returned to the caller.
+    """
+    tagger, manual, cover_data = _job_context
+    log = MessageLog()
+    result = {"meta": meta, "messages": log.messages, "loaded": False, "saved": False, "error": None}
+    audio = tagger.load_file(filepath)
+    # An untagged file is falsy (empty tag mapping), so test for None explicitly
+    if audio is None: return result
+    result["loaded"] = True
+    tags_before = tagger.tag_digest(audio)
+    tagger.apply_metadata(audio, meta, manual, ui=log)
+    if cover_data: tagger.apply_cover(audio, cover_data)
+    try:
+        if not tagger.logger.is_dry:
+            if tagger.save(audio, tags_before): log.message("Tags saved to file.", Colors.GREEN)
+            else: log.message("Tags unchanged, skipped write.", Colors.GREEN)
+        else:
+            log.message("Tags applied (Dry Run).", Colors.BLUE)
+        result["saved"] = True
+    except Exception as e:
+        result["error"] = str(e)
+        log.message(f"ERROR: Failed to save tags to file: {e}", Colors.RED)
+    return result
+
 class SwissTag:
     def __init__(self):
         
         # Determine if help flags are present in sys.argv
-        help_present = any(h in sys.argv for h in ["-h", "--help"])
+        argv = sys.argv[1:]
+        help_flags = {"-h", "--help"}
         
-        if help_present:
-            # 1. Filter out help flags for non-destructive parsing
-            # This allows us to check for other flags without triggering help-exit or parsing errors
-            filtered_argv = [arg for arg in sys.argv if arg not in ["-h", "--help"]]
-            
-            # 2. Handle Help
-            # We pass the filtered list (excluding script name) to analyze which flags were present
-            self.check_extended_help(filtered_argv[1:])
+        if not help_flags.isdisjoint(argv):
+            # Filter out help flags for non-destructive parsing, then pass the remaining
+            # arguments (excluding script name) to analyze which flags were present
+            self.check_extended_help([arg for arg in argv if arg not in help_flags])
             # Exits inside check_extended_help, but ensure it exits cleanly if needed.
             sys.exit(0) 
             
@@ -1173,6 +1820,8 @@ class SwissTag:
         
         # --- Initialization continues if no SystemExit occurred ---
         self.config = ConfigManager(self.args.temp_set)
+        # -t overrides are the same for every file, so parse them once
+        self.manual_tags = self.parse_kv(self.args.manual_tags)
         
         # 2. Apply CLI overrides for mode/source
         if self.args.lyrics: self.config.set("defaults.lyrics.mode", self.args.lyrics)
@@ -1188,23 +1837,21 @@ class SwissTag:
 
         if self.args.setup_token: TokenWizard.run(self.config); sys.exit(0)
         if self.args.config_action: self.handle_config_action(); sys.exit(0)
+        # --about/--version only print, so don't build the providers (or pay for their imports)
+        if self.args.about or self.args.version: return
         
         self.logger = Logger(self.args.debug)
         self.meta_provider = MetadataProvider(self.config, self.logger)
         self.meta_provider.args = self.args
+        if self.args.force_refresh and self.meta_provider.cache: self.meta_provider.cache.refresh = True
         self.file_handler = FileHandler(self.config, self.logger)
         self.tagger = Tagger(self.config, self.logger)
 
     def check_extended_help(self, filtered_args):
         # This function is now only called if -h or --help is detected in sys.argv.
         
-        found_topics = []
-        for arg in filtered_args:
-            clean_arg = arg.split('=')[0]
-            if clean_arg in HELP_MAP: 
-                topic = HELP_MAP[clean_arg]
-                if topic not in found_topics:
-                    found_topics.append(topic)
+        # dict.fromkeys keeps the first occurrence of each topic, in argument order
+        found_topics = list(dict.fromkeys(HELP_MAP[a] for a in (arg.split('=', 1)[0] for arg in filtered_args) if a in HELP_MAP))
         
         if found_topics:
             # DETAILED HELP MODE
@@ -1225,6 +1872,7 @@ class SwissTag:
         parser.add_argument("inputs", nargs="*", default=["."], help="Files or directories")
         parser.add_argument("--install-deps", action="store_true", help="Install dependencies")
         parser.add_argument("--setup-token", action="store_true", help="Setup Genius Token")
+        parser.add_argument("--force-refresh", action="store_true", help="Ignore cached API responses")
         parser.add_argument("-a", "--album", action="store_true", help="Album Mode")
         parser.add_argument("-s", "--search", nargs="+", help="Manual search")
         parser.add_argument("-t", "--manual-tags", nargs="+", help="Override tags")
@@ -1234,6 +1882,7 @@ class SwissTag:
         parser.add_argument("-l", "--lyrics", help="embed, lrc, both, skip")
         parser.add_argument("-L", "--lyrics-source", choices=['auto', 'interactive', 'synced', 'genius'], help="auto, interactive, synced, genius")
         parser.add_argument("-p", "--chromaprint", action="store_true", help="Use acoustic fingerprinting")
+        parser.add_argument("-j", "--jobs", type=int, help="Worker processes for tagging (album mode)")
         parser.add_argument("-d", "--debug", nargs="?", const="dry", help="dry, network, cmd, vars, all")
         parser.add_argument("-C", "--config", nargs="+", dest="config_action", help="config ops")
         parser.add_argument("-S", "--set", dest="temp_set", nargs="+", help="temp config")
@@ -1288,19 +1937,21 @@ class SwissTag:
         queue = []
         for i in self.args.inputs:
             path = Path(i).resolve()
-            if not path.exists():
+            # One stat answers both "does it exist" and "is it a directory"
+            try: is_dir = stat.S_ISDIR(os.stat(path).st_mode)
+            except OSError:
                 print(f"{Colors.YELLOW}[WARN] Path not found: {path}{Colors.RESET}")
                 continue
             
             if self.args.album:
-                if path.is_dir():
+                if is_dir:
                     queue.append(('album', path))
                 else:
                     print(f"{Colors.YELLOW}[WARN] Album mode ignores file: {path.name}{Colors.RESET}")
             else:
-                if path.is_dir():
+                if is_dir:
                     # Expand directory for single mode
-                    files = sorted([f for f in path.iterdir() if f.is_file() and f.suffix.lower() in ['.mp3', '.flac', '.m4a', '.ogg']])
+                    files = self.file_handler.list_audio_files(path)
                     for f in files: queue.append(('single', f))
                 else:
                     queue.append(('single', path))
@@ -1316,6 +1967,16 @@ class SwissTag:
             print("Please target a single file or remove the '-s' argument.")
             return
 
+        # Lookups are independent per file, so run them all before the (interactive) per-file loop.
+        # Fingerprints decide the search query, so with -p fpcalc and the AcoustID lookups are run ahead of time.
+        singles = [path for mode, path in queue if mode == 'single']
+        if len(singles) > 1 and self.args.chromaprint:
+            self.meta_provider.prefetch_fingerprints(singles)
+            self.meta_provider.prefetch_acoustid(singles)
+        elif len(singles) > 1 and self.meta_provider.genius:
+            queries = [self._build_query(f, fs_opts) for f in singles]
+            self.meta_provider.prefetch_search_hits([(q.get('name'), q.get('artist')) for q in queries])
+
         for mode, path in queue:
             if mode == 'album':
                 self.run_album_mode(path, fs_opts)
@@ -1325,21 +1986,21 @@ class SwissTag:
     def _clean_filename_for_search(self, filename: str) -> str:
         """Removes common noise from filenames before using them as search queries."""
         # 1. Remove Bracketed/Parenthesized content that is not explicitly feature (which is handled later)
-        cleaned = re.sub(r'\s*[\(\[].*?(Official Music Video|Lyrics|Audio|Explicit|Remix|Live|\d+kbps).*?[\)\]]', '', filename, flags=re.IGNORECASE)
+        cleaned = _NOISE_TAG_RE.sub('', filename)
         # Remove any lingering brackets/IDs
-        cleaned = re.sub(r'\s*[\(\[].*?[\)\]]', '', cleaned)
+        cleaned = _BRACKETED_RE.sub('', cleaned)
         # Remove leading numbers/hyphens (track numbers)
-        cleaned = re.sub(r'^\s*\d+\s*[-.]?\s*', '', cleaned).strip()
+        cleaned = _TRACKNUM_RE.sub('', cleaned).strip()
         
         return cleaned
 
-    def run_single_mode(self, filepath: Path, fs_opts: List[str]):
+    def _build_query(self, filepath: Path, fs_opts: List[str], ui: Optional[TreeUI] = None) -> Dict:
         """
-        Processes a single file, using the TreeUI structure for cleaner, album-mode-like output.
+        Search query for a single file: existing tags, fingerprint, -s overrides, inferred dirs,
+        then the cleaned filename. Without a ui nothing is printed and fingerprinting is skipped.
         """
-        # Setup TreeUI for a single item
-        ui = TreeUI(total=1)
-        ui.next(f"{filepath.name}")
+        def _message(text, color=None):
+            if ui: ui.message(text, color)
 
         query = {}
         # 0. Pre-fill from existing tags
@@ -1347,7 +2008,7 @@ class SwissTag:
         query.update(existing)
 
         # 1. Fingerprint Check
-        if self.args.chromaprint:
+        if self.args.chromaprint and ui:
             ui.step("Checking acoustic fingerprint...")
             fp_data = self.meta_provider.get_acoustic_fingerprint(filepath)
             if fp_data:
@@ -1364,16 +2025,27 @@ class SwissTag:
         if 'infer-dirs' in fs_opts and not query.get('artist'): 
             inferred = self.file_handler.infer_dirs(filepath)
             query.update(inferred)
-            if inferred: ui.message(f"Inferred Artist/Album: {inferred.get('artist')} / {inferred.get('album')}")
+            if inferred: _message(f"Inferred Artist/Album: {inferred.get('artist')} / {inferred.get('album')}")
         
         # Determine the CLEAN search name (Priority: Existing Tag > Cleaned Filename)
         search_name = query.get('name') or query.get('title')
         if not search_name: 
              # Use the cleaned filename stem for the initial search query
              search_name = self._clean_filename_for_search(filepath.stem)
-             query['name'] = search_name # Use the clean name for the search API call
-             ui.message(f"Cleaned filename for search: {search_name}", Colors.BLUE)
-        
+             _message(f"Cleaned filename for search: {search_name}", Colors.BLUE)
+        # fetch_song_data searches by 'name', including when it came from the existing title tag
+        query['name'] = search_name
+        return query
+
+    def run_single_mode(self, filepath: Path, fs_opts: List[str]):
+        """
+        Processes a single file, using the TreeUI structure for cleaner, album-mode-like output.
+        """
+        # Setup TreeUI for a single item
+        ui = TreeUI(total=1)
+        ui.next(f"{filepath.name}")
+
+        query = self._build_query(filepath, fs_opts, ui)
         if not query.get('name') and not query.get('artist'):
              ui.finish(status='error', warnings=["Could not determine track name or artist. Cannot search."])
              return
@@ -1388,24 +2060,26 @@ class SwissTag:
 
         # 3. Apply/Save Logic 
         audio = self.tagger.load_file(filepath)
+        tags_before = self.tagger.tag_digest(audio)
         success = False
         warnings = []
         has_lyrics = False
 
-        if not audio:
+        # An untagged file is falsy (empty tag mapping), so test for None explicitly
+        if audio is None:
             warnings.append("Could not load audio file.")
         else:
-            manual = self.parse_kv(self.args.manual_tags)
+            manual = self.manual_tags
             
             # --- Tag Preparation ---
             # If online search failed, the resulting 'meta' dictionary may be empty.
             # We must ensure Title/Artist are set using the best available info (existing tags or filename).
             if not meta.get('title'):
                 # If online fetch didn't yield a title, fall back to the cleanest name we derived.
-                meta['title'] = search_name
+                meta['title'] = query['name']
             # Fallback artist if online failed but local tags or inference gave one
-            if not meta.get('artist') and existing.get('artist'):
-                meta['artist'] = existing['artist']
+            if not meta.get('artist') and query.get('artist'):
+                meta['artist'] = query['artist']
             
             # Show planned tags before applying
             display_meta = {k: v for k, v in meta.items() if k not in ['lyrics', 'duration']}
@@ -1427,19 +2101,14 @@ class SwissTag:
             
             # Cover Art Logic
             cover_data = None
-            cover_path = None
             cover_config = self.args.cover_art or self.config.get("defaults.cover")
             
             if cover_config and cover_config != "extract":
                  if self.args.cover_art == "auto" and meta.get("cover_url"):
                      ui.step("Fetching cover art...")
                      try:
-                        r = requests.get(meta["cover_url"])
-                        tmp_art = Path("/tmp/swisstag_cover.jpg")
-                        cover_data = r.content
-                        with open(tmp_art, 'wb') as f: f.write(r.content)
-                        cover_path = str(tmp_art)
-                        self.tagger.apply_cover(audio, cover_path)
+                        cover_data = self.meta_provider.fetch_cover(meta["cover_url"])
+                        self.tagger.apply_cover(audio, cover_data)
                         ui.message("Embedded cover art.", Colors.GREEN)
                      except Exception: 
                          warnings.append("Failed to fetch/embed cover art.")
@@ -1452,8 +2121,8 @@ class SwissTag:
             # Save the file immediately after applying tags/cover, but before FS ops
             try:
                 if not self.logger.is_dry:
-                    audio.save()
-                    ui.message("Tags saved to file.", Colors.GREEN)
+                    if self.tagger.save(audio, tags_before): ui.message("Tags saved to file.", Colors.GREEN)
+                    else: ui.message("Tags unchanged, skipped write.", Colors.GREEN)
                 else:
                     ui.message("Tags applied (Dry Run).", Colors.BLUE)
                 
@@ -1472,17 +2141,14 @@ class SwissTag:
 
             # Filesystem Operations (Only if save succeeded)
             if success:
-                if 'rename' in fs_opts or self.config.get("defaults.rename"):
-                    ui.step("Renaming file...")
-                    new_path = self.file_handler.rename_file(filepath, meta)
-                    if new_path != filepath:
+                rename = bool('rename' in fs_opts or self.config.get("defaults.rename"))
+                sort = 'autosort' in fs_opts
+                if rename or sort:
+                    ui.step("Sorting file..." if sort else "Renaming file...")
+                    new_path = self.file_handler.relocate(filepath, meta, rename, sort)
+                    if new_path.name != filepath.name:
                         ui.message(f"Renamed to: {new_path.name}", Colors.GREEN)
-                    filepath = new_path
-                
-                if 'autosort' in fs_opts:
-                    ui.step("Sorting file...")
-                    new_path = self.file_handler.autosort(filepath, meta)
-                    if new_path != filepath:
+                    if new_path.parent != filepath.parent:
                         ui.message(f"Moved to: {new_path.parent.name} / {new_path.parent.parent.name}", Colors.GREEN)
                     filepath = new_path
                 
@@ -1501,7 +2167,7 @@ class SwissTag:
                         warnings.append("Lyrics were expected but not found/fetched.")
 
                 # Duration Validation Check (if chromaprint was used)
-                if audio and meta.get('duration'):
+                if audio is not None and meta.get('duration'):
                      local_dur = audio.info.length
                      if abs(local_dur - int(meta['duration'])) > 10:
                          warnings.append(f"Duration mismatch: Local {int(local_dur)}s vs Remote {meta['duration']}s")
@@ -1514,22 +2180,32 @@ class SwissTag:
         ui.finish(status, warnings)
 
     def manual_match_interface(self, files, tracks):
+        """
+        Lists the unmatched files and tracks once, then asks for a track per file.
+        Track numbers stay fixed; answers like '1:3, 2:5, 3:s' (file:track) cover several files at once.
+        """
         matched = []
-        available_tracks = list(tracks)
+        taken = set()
+        answers: Dict[int, str] = {}  # file index -> pending batch answer
         print("\n=== Manual Matching Required ===")
-        for f in files:
-            print(f"\nFile: {f.name}")
-            print("Available Tracks:")
-            for i, t in enumerate(available_tracks): print(f"  [{i+1}] {t['number']}. {t['title']} ({t['artist']})")
+        # Box sets can list hundreds of entries; build each table as one string and write it once
+        print("Files:\n" + "\n".join(f"  ({i}) {f.name}" for i, f in enumerate(files, 1)))
+        print("Available Tracks:\n" + "\n".join(f"  [{i}] {t['number']}. {t['title']} ({t['artist']})" for i, t in enumerate(tracks, 1)))
+        print("Tip: answer several files at once with (file):[track] pairs, e.g. 1:3, 2:5, 3:s")
+        for fi, f in enumerate(files):
             while True:
-                choice = input(f"Select track # for '{f.name}' (or 's' to skip): ").strip().lower()
+                choice = answers.pop(fi, None) or input(f"Select track # for '{f.name}' (or 's' to skip): ").strip().lower()
+                if ':' in choice:
+                    answers.update((int(a) - 1, b) for a, b in _MATCH_PAIR_RE.findall(choice))
+                    continue
                 if choice == 's': break
                 if choice.isdigit():
                     idx = int(choice) - 1
-                    if 0 <= idx < len(available_tracks):
-                        selected = available_tracks.pop(idx)
-                        matched.append((f, selected))
+                    if 0 <= idx < len(tracks) and idx not in taken:
+                        taken.add(idx)
+                        matched.append((f, tracks[idx]))
                         break
+                    if idx in taken: print(f"  Track [{choice}] is already assigned.")
         return matched
 
     def run_album_mode(self, directory: Path, fs_opts: List[str]):
@@ -1547,41 +2223,38 @@ class SwissTag:
         candidates = self.meta_provider.search_album_candidates(search_q)
         if not candidates: return print("    No matching albums found on Genius.")
 
-        selected_id = None
+        # Keep the chosen candidate itself, so its title doesn't have to be looked up again by id
         if len(candidates) == 1:
-            c = candidates[0]
-            print(f"\n    Found 1 match: {c['title']} by {c['artist']}")
+            selected = candidates[0]
+            print(f"\n    Found 1 match: {selected['title']} by {selected['artist']}")
             choice = input("    Is this correct? [Y/n] ").lower().strip()
-            if choice in ['', 'y', 'yes']: selected_id = c['id']
-            else: return
+            if choice not in ['', 'y', 'yes']: return
         else:
             print(f"\n    Found {len(candidates)} matches:")
             for i, c in enumerate(candidates, 1): print(f"    [{i}] {c['title']} - {c['artist']}")
             choice = input(f"\n    Select an album (1-{len(candidates)}, n to abort): ").lower().strip()
-            if choice.isdigit() and 1 <= int(choice) <= len(candidates): selected_id = candidates[int(choice)-1]['id']
+            if choice.isdigit() and 1 <= int(choice) <= len(candidates): selected = candidates[int(choice)-1]
             else: return
 
-        selected_title = "Unknown"
-        for c in candidates:
-             if c['id'] == selected_id: selected_title = f"{c['title']} by {c['artist']}"; break
+        selected_title = f"{selected['title']} by {selected['artist']}"
         print("") 
         
-        album_meta = self.meta_provider.fetch_album_by_id(selected_id)
+        album_meta = self.meta_provider.fetch_album_by_id(selected['id'])
         if not album_meta.get('tracks'): return self.logger.error("No tracks found.")
 
-        local_files = sorted([f for f in directory.iterdir() if f.suffix.lower() in ['.mp3', '.flac', '.m4a', '.ogg']])
+        local_files = self.file_handler.list_audio_files(directory)
         matched_pairs = []
         
         if len(local_files) == len(album_meta['tracks']) and not 'match-filename' in fs_opts:
             for i, f in enumerate(local_files): matched_pairs.append((f, album_meta['tracks'][i]))
         else:
-            for f in local_files:
-                clean_name = re.sub(r"^\d+\s*[-.]?\s*", "", f.stem)
-                best_track = None; best_score = 0
-                for t in album_meta['tracks']:
-                    score = fuzz.token_sort_ratio(clean_name, t['title'])
-                    if score > best_score: best_score = score; best_track = t
-                if best_score > 60: matched_pairs.append((f, best_track))
+            norm_stems = [normalize_for_match(_TRACKNUM_RE.sub("", f.stem)) for f in local_files]
+            # Older cache entries predate _norm_title
+            titles = [t.get('_norm_title') or normalize_for_match(t['title']) for t in album_meta['tracks']]
+            scores = fuzzy_score_matrix(norm_stems, titles, score_cutoff=60)
+            # Each track can only be claimed by one file
+            for i, j in assign_best_pairs(scores):
+                if scores[i][j] > 60: matched_pairs.append((local_files[i], album_meta['tracks'][j]))
 
         matched_files_set = {f for f, t in matched_pairs}
         unmatched_files = [f for f in local_files if f not in matched_files_set]
@@ -1603,17 +2276,15 @@ class SwissTag:
                 for t in missing_tracks: f.write(f"{t['number']}. {t['title']} - {t['artist']}\n")
             print(f"{Colors.BOLD}Created list at: {missing_file}{Colors.RESET}\n")
 
-        cover_path = None; cover_data = None
+        cover_data = None; cover_job = None
         # Check if cover fetching is requested or not explicitly disabled
         cover_config = self.args.cover_art or self.config.get("defaults.cover")
         if cover_config and cover_config != "extract": # Extract handled later
             if self.args.cover_art == "auto" and album_meta.get("cover_url"):
-                try:
-                    r = requests.get(album_meta["cover_url"])
-                    cover_path = "/tmp/swisstag_cover.jpg"
-                    cover_data = r.content 
-                    with open(cover_path, 'wb') as f: f.write(r.content)
-                except Exception: pass
+                # Downloads in the background while lyrics are fetched; collected before tagging starts
+                cover_pool = ThreadPoolExecutor(max_workers=1)
+                cover_job = cover_pool.submit(self.meta_provider.fetch_cover, album_meta["cover_url"])
+                cover_pool.shutdown(wait=False)
             elif self.args.cover_art and self.args.cover_art.startswith("file="):
                 cover_path = self.args.cover_art.split("=", 1)[1]
                 try:
@@ -1621,104 +2292,125 @@ class SwissTag:
                 except Exception: pass
 
         inferred_artist = query.get('artist') if 'infer-dirs' in fs_opts else None
-        ui = TreeUI(len(matched_pairs), album_name=selected_title)
         lyr_src = self.config.get("defaults.lyrics.source", "interactive")
-
+        fetch_lyrics = self.config.get("defaults.lyrics.fetch", True)
+        # Lookups that never prompt (auto's rescue aside) can all go out at once
+        prefetched = {}
+        if fetch_lyrics:
+            prefetched = self.meta_provider.prefetch_lyrics([(t['id'], t['title'], t['artist']) for _, t in matched_pairs], lyr_src)
+
+        # 1. Build per-track metadata and fetch lyrics. Lyrics may prompt the user, so this stays serial.
+        prepared = []
+        lyrics_ui = TreeUI(len(matched_pairs), album_name=selected_title, heading="Fetching lyrics for") if fetch_lyrics else None
+        # The album artist is the same for every track
+        genius_album_artist = album_meta['artist']
+        a_artist_list = []
+        if inferred_artist: a_artist_list.append(inferred_artist)
+        if genius_album_artist and genius_album_artist != inferred_artist: a_artist_list.append(genius_album_artist)
+        if not a_artist_list: a_artist_list = ["Unknown"]
         for filepath, track in matched_pairs:
-            ui.next(f"{filepath.name}")
             genius_track_artist = track['artist']
-            genius_album_artist = album_meta['artist']
-            t_artist_list = []; a_artist_list = []
-            if inferred_artist: t_artist_list.append(inferred_artist); a_artist_list.append(inferred_artist)
+            t_artist_list = []
+            if inferred_artist: t_artist_list.append(inferred_artist)
             if genius_track_artist and genius_track_artist != inferred_artist: t_artist_list.append(genius_track_artist)
-            if genius_album_artist and genius_album_artist != inferred_artist: a_artist_list.append(genius_album_artist)
             if not t_artist_list: t_artist_list = ["Unknown"]
-            if not a_artist_list: a_artist_list = ["Unknown"]
 
             file_meta = {
                 "title": track['title'], "track_number": track['number'],
                 "artist": t_artist_list, "album": album_meta['album'],
-                "album_artist": a_artist_list, "year": album_meta['year'], "genre": album_meta['genre']
+                "album_artist": list(a_artist_list), "year": album_meta['year'], "genre": album_meta['genre']
             }
             
             # Fetch lyrics only if requested
-            has_lyrics = False
-            if self.config.get("defaults.lyrics.fetch", True):
-                ui.step("Fetching lyrics...")
-                lyrics = self.meta_provider.fetch_lyrics_for_track(track['id'], title=track['title'], artist=track['artist'], source_mode=lyr_src, ui=ui)
-                if lyrics: file_meta['lyrics'] = lyrics; has_lyrics = True
-            
-            ui.step("Applying tags...")
-            audio = self.tagger.load_file(filepath)
-            
-            # Duration Validation
-            warnings = []
-            if audio:
-                local_dur = audio.info.length
-                # We assume user manually verifies duration for now or we could fetch it from MB if available
-                # but since we mostly have Genius data here, we might skip precise check unless we had -p data
-                pass
-
-            write_success = False
-            if audio:
-                manual = self.parse_kv(self.args.manual_tags)
-                
-                # Show planned tags before applying
-                try:
-                    # Filter out lyrics from display
-                    display_meta = {k: v for k, v in file_meta.items() if k != 'lyrics'}
-                    
-                    if 'artist' in display_meta and isinstance(display_meta['artist'], list):
-                        display_meta['artist'] = self.tagger._join_artists(display_meta['artist'])
-                    
-                    ui.message(f"Planned tags:", color=Colors.BLUE)
-                    for k in sorted(display_meta.keys()):
-                        ui.message(f"  {k}: {display_meta[k]}", color=Colors.BLUE)
-                except Exception:
-                    pass
-
-                self.tagger.apply_metadata(audio, file_meta, manual, ui=ui)
-                if cover_path: self.tagger.apply_cover(audio, cover_path)
-                if cover_data: self.tagger.save_cover(filepath, cover_data, album_meta['album'])
-                
-                # SAVE FILE
-                try:
-                    if not self.logger.is_dry:
-                        audio.save()
-                        ui.message("Tags saved to file.", Colors.GREEN)
-                    else:
-                        ui.message("Tags applied (Dry Run).", Colors.BLUE)
-                    write_success = True
-                except Exception as e:
-                    warnings.append(f"Failed to save tags to file: {e}")
-                    ui.message(f"ERROR: Failed to save tags to file: {e}", Colors.RED)
-                    write_success = False
-
-            
-            if 'rename' in fs_opts or self.config.get("defaults.rename"):
-                ui.step("Renaming...")
-                filepath = self.file_handler.rename_file(filepath, file_meta)
-            
-            if 'autosort' in fs_opts:
-                ui.step("Sorting...")
-                filepath = self.file_handler.autosort(filepath, file_meta)
-            
-            if self.args.lyrics and file_meta.get('lyrics'):
-                l_mode = self.config.get("defaults.lyrics.mode")
-                if l_mode in ['lrc', 'both']: self.file_handler.save_lrc(filepath, file_meta['lyrics'])
-            
-            status = 'success'
-            if not write_success: status = 'error'
-            elif self.config.get("defaults.lyrics.fetch", True) and not has_lyrics: 
-                status = 'warning'
-                warnings.append("Missing lyrics")
+            if lyrics_ui:
+                lyrics_ui.next(f"{track['title']}")
+                lyrics_ui.step("Fetching lyrics...")
+                if track['id'] in prefetched:
+                    lyrics = prefetched[track['id']]
+                    # Auto's interactive rescue can't run in the prefetch threads
+                    if not lyrics and lyr_src == 'auto': lyrics = self.meta_provider.rescue_lyrics(track['title'], track['artist'], ui=lyrics_ui)
+                else: lyrics = self.meta_provider.fetch_lyrics_for_track(track['id'], title=track['title'], artist=track['artist'], source_mode=lyr_src, ui=lyrics_ui)
+                if lyrics:
+                    file_meta['lyrics'] = lyrics
+                    lyrics_ui.finish('success')
+                else:
+                    lyrics_ui.finish('warning', ["No lyrics found"])
+            prepared.append((filepath, file_meta))
+        if lyrics_ui: print("")
 
-            ui.finish(status, warnings)
+        if cover_job:
+            try: cover_data = cover_job.result()
+            except Exception: pass
 
-if __name__ == "__main__":
+        # 2. Load/tag/save every file in worker processes; results come back in order for the tree UI
+        manual = self.manual_tags
+        # Per-run options, read once rather than per track
+        rename = bool('rename' in fs_opts or self.config.get("defaults.rename"))
+        sort = 'autosort' in fs_opts
+        write_lrc = bool(self.args.lyrics) and self.config.get("defaults.lyrics.mode") in ['lrc', 'both']
+        ui = TreeUI(len(prepared), album_name=selected_title)
+        jobs = [(filepath, dict(file_meta)) for filepath, file_meta in prepared]
+        workers = min(len(jobs), self.args.jobs or self.config.get("defaults.workers") or os.cpu_count() or 1)
+        context = (self.tagger, manual, cover_data)
+        pool = None
+        if workers > 1:
+            # multiprocessing is only imported when album mode actually spreads work over processes
+            from concurrent.futures import ProcessPoolExecutor
+            # The tagger and cover are shipped once per worker; jobs only carry (filepath, meta)
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=init_tag_worker, initargs=context)
+        else: init_tag_worker(*context)
+        try:
+            results = pool.map(tag_file_job, *zip(*jobs)) if pool else (tag_file_job(*job) for job in jobs)
+            for (filepath, file_meta), result in zip(prepared, results):
+                ui.next(f"{filepath.name}")
+                has_lyrics = bool(file_meta.get('lyrics'))
+                warnings = []
+
+                if result['loaded']:
+                    # Show planned tags (as they were before aliases/feature handling were applied)
+                    try:
+                        # Filter out lyrics from display
+                        display_meta = {k: v for k, v in file_meta.items() if k != 'lyrics'}
+                        
+                        if 'artist' in display_meta and isinstance(display_meta['artist'], list):
+                            display_meta['artist'] = self.tagger._join_artists(display_meta['artist'])
+                        
+                        ui.message(f"Planned tags:", color=Colors.BLUE)
+                        for k in sorted(display_meta.keys()):
+                            ui.message(f"  {k}: {display_meta[k]}", color=Colors.BLUE)
+                    except Exception:
+                        pass
+                    for text, color in result['messages']: ui.message(text, color)
+                    if result['error']: warnings.append(f"Failed to save tags to file: {result['error']}")
+                    if cover_data: self.tagger.save_cover(filepath, cover_data, album_meta['album'])
+                # Worker returns the metadata after aliases/feature handling, which rename/autosort rely on
+                file_meta = result['meta']
+                write_success = result['saved']
+
+                if rename or sort:
+                    ui.step("Sorting..." if sort else "Renaming...")
+                    filepath = self.file_handler.relocate(filepath, file_meta, rename, sort)
+                
+                if write_lrc and file_meta.get('lyrics'): self.file_handler.save_lrc(filepath, file_meta['lyrics'])
+                
+                status = 'success'
+                if not write_success: status = 'error'
+                elif fetch_lyrics and not has_lyrics: 
+                    status = 'warning'
+                    warnings.append("Missing lyrics")
+
+                ui.finish(status, warnings)
+        finally:
+            if pool: pool.shutdown(cancel_futures=True)
+
+def main():
+    if NO_DEPS_FLAGS.isdisjoint(sys.argv[1:]): ensure_dependencies()
     try:
         app = SwissTag()
         app.run()
     except KeyboardInterrupt:
         print(f"\n{Colors.RED}Aborted by user.{Colors.RESET}")
-        sys.exit(130)
\ No newline at end of file
+        sys.exit(130)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file